@@ -1,14 +1,19 @@
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask import Flask, render_template, request, jsonify, send_from_directory, redirect, url_for
 import os
 import json
+import hashlib
 from pathlib import Path
 import subprocess
 import threading
 from datetime import datetime
 
+# Paths are anchored to the app directory rather than the process working directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, 'config.ini')
+
 app = Flask(__name__)
-app.config['UPLOAD_FOLDER'] = 'data/input'
-app.config['OUTPUT_FOLDER'] = 'data/output'
+app.config['UPLOAD_FOLDER'] = os.path.join(BASE_DIR, 'data', 'input')
+app.config['OUTPUT_FOLDER'] = os.path.join(BASE_DIR, 'data', 'output')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
 # Store the current job status
@@ -20,12 +25,19 @@ job_status = {
     'completed': False
 }
 
+# Inputs of the last successful run and the outputs it wrote, so an identical rerun can reuse them
+last_run = {
+    'fingerprint': None,
+    'outputs': None,
+    'output': []
+}
+
 def read_config():
     """Read current configuration from config.ini"""
     config = {}
     current_section = None
     
-    with open('config.ini', 'r') as f:
+    with open(CONFIG_PATH, 'r') as f:
         for line in f:
             line = line.strip()
             if line.startswith('[') and line.endswith(']'):
@@ -68,7 +80,7 @@ capstone_duration_sidang_4 = {capstone_duration_sidang_4}
 time_slot_dur = {time_slot_dur}
 """
     
-    with open('config.ini', 'w') as f:
+    with open(CONFIG_PATH, 'w') as f:
         f.write(config_template.format(**config_data))
 
 @app.route('/')
@@ -106,7 +118,8 @@ def upload_file():
     if file and file.filename.endswith('.csv'):
         filename = file.filename
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        # Streamed to disk in 1 MiB chunks
+        file.save(filepath, buffer_size=1024 * 1024)
         return jsonify({'success': True, 'filename': filename})
     
     return jsonify({'success': False, 'error': 'Invalid file type. Only CSV files allowed.'})
@@ -144,14 +157,50 @@ def run_scheduler():
     
     return jsonify({'success': True})
 
+def input_fingerprint(config):
+    """Hash config.ini and the input files it names"""
+    digest = hashlib.blake2b(digest_size=16)
+    paths = [CONFIG_PATH] + [os.path.join(app.config['UPLOAD_FOLDER'], config.get(key, ''))
+                              for key in ('avail_fname', 'req_fname')]
+    for path in paths:
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def output_state(config):
+    """Size and modification time of each output file, or None if one is missing"""
+    state = []
+    for key in ('out_fname', 'out_timeslot', 'out_lectureschedule'):
+        path = os.path.join(app.config['OUTPUT_FOLDER'], config.get(key, ''))
+        if not os.path.isfile(path):
+            return None
+        stat = os.stat(path)
+        state.append((stat.st_size, stat.st_mtime_ns))
+    return state
+
 def execute_scheduler():
     """Execute the scheduler script"""
     global job_status
     
     try:
-        # Run the scheduler
+        # Skip the run if the config and input files are unchanged since the last successful
+        # run and its output files are still in place
+        config = read_config()
+        fingerprint = input_fingerprint(config)
+        if (fingerprint is not None and fingerprint == last_run['fingerprint'] and
+                output_state(config) == last_run['outputs']):
+            job_status['output'] = last_run['output'] + ['Inputs unchanged since the last run, reusing its output files']
+            job_status['completed'] = True
+            job_status['progress'] = 'Scheduler completed successfully!'
+            return
+        
+        # Run the scheduler, unbuffered so its output reaches the console as it is printed
+        # rather than in pipe-buffer-sized bursts
         process = subprocess.Popen(
-            ['python', 'src/main.py'],
+            ['python', '-u', 'src/main.py'],
+            cwd=BASE_DIR,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             universal_newlines=True,
@@ -170,6 +219,9 @@ def execute_scheduler():
         if process.returncode == 0:
             job_status['completed'] = True
             job_status['progress'] = 'Scheduler completed successfully!'
+            last_run['fingerprint'] = fingerprint
+            last_run['outputs'] = output_state(config)
+            last_run['output'] = list(job_status['output'])
         else:
             job_status['error'] = f'Scheduler exited with code {process.returncode}'
             job_status['progress'] = 'Scheduler failed'
@@ -184,14 +236,23 @@ def execute_scheduler():
 @app.route('/status')
 def get_status():
     """Get current job status"""
-    return jsonify(job_status)
+    # With ?since=N only the output lines after the first N are sent, instead of the whole log on every poll
+    since = request.args.get('since', type=int)
+    if since is None:
+        return jsonify(job_status)
+    
+    status = dict(job_status)
+    status['output'] = job_status['output'][since:]
+    status['output_start'] = since
+    return jsonify(status)
 
 @app.route('/download/<filename>')
 def download_file(filename):
     """Download output file"""
     filepath = os.path.join(app.config['OUTPUT_FOLDER'], filename)
     if os.path.exists(filepath):
-        return send_file(filepath, as_attachment=True)
+        # Served as a conditional response (ETag/Last-Modified), so an unchanged file is not sent again
+        return send_from_directory(app.config['OUTPUT_FOLDER'], filename, as_attachment=True, conditional=True)
     return jsonify({'success': False, 'error': 'File not found'})
 
 @app.route('/validate/<filename>')
@@ -207,6 +268,7 @@ def validate_timeslots(filename):
             ['python', 'validate_timeslots.py', 
              os.path.join(app.config['OUTPUT_FOLDER'], filename),
              parallel_event],
+            cwd=BASE_DIR,
             capture_output=True,
             text=True
         )
@@ -66,9 +66,12 @@ class Cleaner:
                 # Empty list, array, or series
                 self.dataframe['lecturers'].at[index, 'used_timeslot'] = ""
                 continue
-            elif isinstance(used_timeslot, (list, np.ndarray)) or hasattr(used_timeslot, 'tolist'):
-                # Handle list, numpy array, or pandas Series
-                timeslot_list = used_timeslot.tolist() if hasattr(used_timeslot, 'tolist') else used_timeslot
+            elif isinstance(used_timeslot, (list, set, np.ndarray)) or hasattr(used_timeslot, 'tolist'):
+                # Handle list, set (listed chronologically), numpy array, or pandas Series
+                if isinstance(used_timeslot, set):
+                    timeslot_list = sorted(used_timeslot)
+                else:
+                    timeslot_list = used_timeslot.tolist() if hasattr(used_timeslot, 'tolist') else used_timeslot
                 
                 if len(timeslot_list) > 0:
                     formatted_schedules = []
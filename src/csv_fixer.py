@@ -85,10 +85,11 @@ def normalize_csv_for_scheduler(csv_path: str, csv_type: str = 'request') -> str
     if csv_type != 'request':
         return csv_path
     
-    # Read the fixed CSV
+    # Read the fixed CSV (header once, then each non-empty row zipped onto it)
     with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = [dict(zip(header, row)) for row in reader if row]
     
     # Check if this is the new format (has 'Timestamp' column)
     if not rows or 'Timestamp' not in rows[0]:
@@ -1,3 +1,5 @@
+import logging
+
 import pandas as pd
 import numpy as np
 
@@ -6,6 +8,30 @@ pd.set_option('display.max_rows', None)
 pd.set_option('display.width', None)
 pd.set_option('display.max_colwidth', None)
 
+logger = logging.getLogger(__name__)
+
+
+def _rank_descending(values, method):
+    """
+    Rank values in descending order (largest value gets rank 1), equivalent to
+    `pd.Series(values).rank(method=method, ascending=False)` for 'min' and 'max'.
+    
+    Args:
+        values (numpy.ndarray): Values to rank
+        method (str): How to rank tied values, either 'min' or 'max'
+        
+    Returns:
+        numpy.ndarray: Float ranks aligned with `values`
+    """
+    sorted_values = np.sort(values)
+    if method == 'max':
+        # Number of values greater than or equal to each value
+        ranks = len(values) - np.searchsorted(sorted_values, values, side='left')
+    else:
+        # One plus the number of values strictly greater than each value
+        ranks = len(values) - np.searchsorted(sorted_values, values, side='right') + 1
+    return ranks.astype(float)
+
 class ThesisScheduler:
     def __init__(self, dataframes, config, round2=True):
         self.dataframes = dataframes
@@ -22,8 +48,94 @@ class ThesisScheduler:
         
         # add new column `num_assignment` and `used_timeslot` to lecturers dataframe
         self.dataframes['lecturers']['num_assignment'] = 0
-        self.dataframes['lecturers']['used_timeslot'] = pd.NaT
+        # `used_timeslot` holds a set per lecturer so assignments can be added and reverted in O(1)
+        self.dataframes['lecturers']['used_timeslot'] = [set() for _ in range(len(self.dataframes['lecturers']))]
         self.lect_pool = self.dataframes['lecturers']['kode_dosen'].copy().to_numpy()
+        
+        # Row label of each lecturer in the lecturers dataframe, so lookups by code
+        # don't build a boolean mask over the whole table
+        self._lect_row = {}
+        for row_idx, lecturer_code in self.dataframes['lecturers']['kode_dosen'].items():
+            self._lect_row.setdefault(lecturer_code, row_idx)
+        
+        # Expertise values of each lecturer gathered once as plain sets, so expertise
+        # checks don't fetch a lecturer row as a Series for every candidate
+        expertise_columns = [col for col in self.dataframes['lecturers'].columns if 'expertise' in col.lower()]
+        lecturer_records = self.dataframes['lecturers'][expertise_columns].to_dict('index')
+        self._lecturer_expertise = {
+            lecturer_code: self._collect_expertise(lecturer_records[row_idx])
+            for lecturer_code, row_idx in self._lect_row.items()
+        }
+
+        # Map raw timeslot keys (YYYYMMDD_HHMM) to their row in the timeslots dataframe
+        # so lookups don't need to reformat strings and scan the date/time columns
+        timeslots = self.dataframes['timeslots']
+        timeslot_keys = timeslots['date'].str.replace('-', '') + '_' + timeslots['time'].str.replace(':', '')
+        self._ts_row = dict(zip(timeslot_keys, timeslots.index))
+        self._slot_columns = [col for col in timeslots.columns if col.startswith('slot_')]
+
+        # Integer mirror of the slot cells (timeslot row x slot column): -1 for a free ('none') slot,
+        # otherwise an id into self._assignment_names. Kept in sync on every assign/revert
+        self._assignment_names = []
+        self._assignment_ids = {}
+        slot_values = timeslots[self._slot_columns].to_numpy()
+        self._slot_owner = np.full(slot_values.shape, -1, dtype=np.int32)
+        for (row_pos, slot_pos), value in np.ndenumerate(slot_values):
+            if value != 'none':
+                self._slot_owner[row_pos, slot_pos] = self._get_assignment_id(value)
+
+        # Chronological order of the availability timeslots, each slot's position in that order
+        # and its 30-minute successor (None when the next slot doesn't exist, e.g. end of day)
+        time_columns = [col for col in self.dataframes['lecturer_availability'].columns
+                        if col not in ['kode_dosen', 'availability_count']]
+        slot_times = pd.to_datetime(time_columns, format='%Y%m%d_%H%M')
+        next_slots = (slot_times + pd.Timedelta(minutes=30)).strftime('%Y%m%d_%H%M')
+        self._ts_order = [time_columns[i] for i in slot_times.argsort()]
+        self._ts_idx = {timeslot: i for i, timeslot in enumerate(self._ts_order)}
+        self._next_ts = {
+            timeslot: (next_slot if next_slot in self._ts_idx else None)
+            for timeslot, next_slot in zip(time_columns, next_slots)
+        }
+
+        # Lecturer availability as a boolean matrix (lecturer row x chronological timeslot)
+        lecturer_availability = self.dataframes['lecturer_availability']
+        self._avail = lecturer_availability[self._ts_order].isin([True, 'TRUE', 'True']).to_numpy()
+        self._avail_count = lecturer_availability['availability_count'].to_numpy()
+        self._avail_row = {}
+        for row_pos, lecturer_code in enumerate(lecturer_availability['kode_dosen']):
+            self._avail_row.setdefault(lecturer_code, row_pos)
+        # The same matrix packed into one integer bitmask per lecturer (bit s = chronological slot s),
+        # plus a bitmask of slots directly followed by the next 30-minute slot
+        self._avail_bits = [
+            int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little') for row in self._avail
+        ]
+        self._link_bits = sum(
+            1 << pos for pos, timeslot in enumerate(self._ts_order) if self._next_ts[timeslot] is not None
+        )
+        self._window_cache = {}
+
+        # Timeslot durations from config, coerced to int once
+        self._durations = {
+            key: int(self.config[key]) for key in [
+                'default_timeslot', 'capstone_duration_2', 'capstone_duration_3', 'capstone_duration_4',
+                'default_timeslot_sidang', 'capstone_duration_sidang_2', 'capstone_duration_sidang_3',
+                'capstone_duration_sidang_4'
+            ]
+        }
+        self._timeslot_needed_cache = {}
+
+        # Row label of each student's request (the first one if a NIM appears more than once)
+        self._nim_row = {}
+        for row_idx, nim in self.dataframes['request']['nim'].items():
+            self._nim_row.setdefault(nim, row_idx)
+
+        # Row positions of each capstone group's requests, grouped once so group lookups
+        # don't rescan the capstone_code column
+        self._capstone_groups = self.dataframes['request'].groupby('capstone_code').indices
+
+        # Which examiner roles are still unassigned for each request row (examiner_1, examiner_2),
+        # kept in sync with every write to the examiner columns
+        self._pending_examiner_mask = self.dataframes['request'][['examiner_1', 'examiner_2']].isna().to_numpy()
 
         # Preserve original examiner assignments (especially for Sidang Akhir) to avoid overwrites
         self.original_examiners = {}
@@ -244,6 +356,7 @@ class ThesisScheduler:
                 if pd.notna(orig_val) and pd.isna(current_request.get(role)):
                     # Restore into main dataframe and current_request copy
                     self.dataframes['request'].loc[self.dataframes['request']['nim'] == nim, role] = orig_val
+                    self._sync_pending_examiners(self.dataframes['request']['nim'] == nim)
                     current_request[role] = orig_val
                     print(f"[RESTORE] Restored original {role} '{orig_val}' for Sidang Akhir NIM {nim}")
 
@@ -303,15 +416,16 @@ class ThesisScheduler:
             assigned_datetime = None
             if len(selected_examiners) > 0:
                 # Get the intersection of all selected examiners' available timeslots
-                common_timeslots = set(selected_examiners.iloc[0]['matched_timeslots'])
+                # (matched_timeslots holds indices into the chronological timeslot order)
+                common_timeslots = set(selected_examiners.iloc[0]['matched_timeslots'].tolist())
                 
                 for idx in range(1, len(selected_examiners)):
-                    examiner_timeslots = set(selected_examiners.iloc[idx]['matched_timeslots'])
+                    examiner_timeslots = selected_examiners.iloc[idx]['matched_timeslots'].tolist()
                     common_timeslots = common_timeslots.intersection(examiner_timeslots)
                 
                 if common_timeslots:
-                    # Use the first available common timeslot
-                    assigned_datetime = list(common_timeslots)[0]
+                    # Use the first available common timeslot (the earliest one)
+                    assigned_datetime = self._ts_order[min(common_timeslots)]
                     print(f"Found common timeslot for all selected examiners: {assigned_datetime}")
                 else:
                     print(f"Error: No common timeslots found for selected examiners {examiner_codes}")
@@ -330,7 +444,7 @@ class ThesisScheduler:
         # Update request dataframe
         if request_type == 'capstone' and capstone_code:
             # Update all requests in the same capstone group
-            group_mask = self.dataframes['request']['capstone_code'] == capstone_code
+            group_mask = self._capstone_mask(capstone_code)
             
             # Assign examiners only if there are new examiners to assign
             if examiner_codes:
@@ -342,6 +456,7 @@ class ThesisScheduler:
                     examiner_idx += 1
                 if pd.isna(current_request.get('examiner_2')) and examiner_idx < len(examiner_codes) and not (sidang and pd.notna(orig.get('examiner_2'))):
                     self.dataframes['request'].loc[group_mask, 'examiner_2'] = examiner_codes[examiner_idx]
+                self._sync_pending_examiners(group_mask)
             
             # Update datetime and status
             self.dataframes['request'].loc[group_mask, 'date_time'] = assigned_datetime
@@ -359,6 +474,7 @@ class ThesisScheduler:
                     examiner_idx += 1
                 if pd.isna(current_request.get('examiner_2')) and examiner_idx < len(examiner_codes) and not (sidang and pd.notna(orig.get('examiner_2'))):
                     self.dataframes['request'].loc[request_mask, 'examiner_2'] = examiner_codes[examiner_idx]
+                self._sync_pending_examiners(request_mask)
             
             # Update datetime and status
             self.dataframes['request'].loc[request_mask, 'date_time'] = assigned_datetime
@@ -390,35 +506,19 @@ class ThesisScheduler:
         
         # Update lecturer_availability dataframe (lecturers table) - only for newly assigned examiners
         for examiner_code in examiner_codes:
-            lecturer_mask = self.dataframes['lecturers']['kode_dosen'] == examiner_code
-            
-            if lecturer_mask.any():
-                # Get the index of the lecturer row
-                lecturer_idx = self.dataframes['lecturers'][lecturer_mask].index[0]
+            # Get the index of the lecturer row
+            lecturer_idx = self._lect_row.get(examiner_code)
+            
+            if lecturer_idx is not None:
+                # Add new timeslot to the lecturer's used timeslots
+                used_timeslots = self.dataframes['lecturers'].at[lecturer_idx, 'used_timeslot']
+                if assigned_datetime:
+                    used_timeslots.add(assigned_datetime)
                 
-                # Get current used_timeslot list
-                current_used = self.dataframes['lecturers'].loc[lecturer_idx, 'used_timeslot']
-                
-                # Handle different types of current_used values
-                if current_used is None or (hasattr(current_used, '__len__') and len(current_used) == 0):
-                    used_timeslots = []
-                elif isinstance(current_used, list):
-                    used_timeslots = current_used.copy()
-                elif pd.isna(current_used) if not isinstance(current_used, (list, np.ndarray)) else False:
-                    used_timeslots = []
-                else:
-                    # Handle single values or convert to list
-                    used_timeslots = [current_used] if current_used else []
-                
-                # Add new timeslot if not already present
-                if assigned_datetime and assigned_datetime not in used_timeslots:
-                    used_timeslots.append(assigned_datetime)
-                
-                # Update used_timeslot and num_assignment - assign directly to the specific row
-                self.dataframes['lecturers'].at[lecturer_idx, 'used_timeslot'] = used_timeslots
+                # Update num_assignment - assign directly to the specific row
                 self.dataframes['lecturers'].at[lecturer_idx, 'num_assignment'] = len(used_timeslots)
                 
-                print(f"Updated lecturer {examiner_code}: assignments={len(used_timeslots)}, timeslots={used_timeslots}")
+                print(f"Updated lecturer {examiner_code}: assignments={len(used_timeslots)}, timeslots={sorted(used_timeslots)}")
         
         return True
 
@@ -453,53 +553,12 @@ class ThesisScheduler:
         # Create boolean mask for lecturers that match field requirements
         matching_lecturers = []
         
-        # Find expertise columns dynamically
-        expertise_columns = [col for col in self.dataframes['lecturers'].columns if 'expertise' in col.lower()]
+        targets = self._field_targets(field_1, field_2)
         
         for lecturer_code in temp_lect_pool:
-            # Get lecturer row
-            lecturer_row = self.dataframes['lecturers'][
-                self.dataframes['lecturers']['kode_dosen'] == lecturer_code
-            ]
-            
-            if not lecturer_row.empty:
-                lecturer_row = lecturer_row.iloc[0]
-                
-                # Check if lecturer's expertise matches either field_1 OR field_2
-                expertise_match = False
-                
-                # Check all expertise columns
-                for expertise_col in expertise_columns:
-                    if expertise_col in lecturer_row:
-                        expertise_value = lecturer_row[expertise_col]
-                        
-                        # Handle different types of expertise values - check type first
-                        if isinstance(expertise_value, (list, np.ndarray)):
-                            # If it's a list/array, check each element
-                            for expertise_item in expertise_value:
-                                if pd.notna(expertise_item):
-                                    expertise_str = str(expertise_item).strip()
-                                    field_1_str = str(field_1).strip() if pd.notna(field_1) else ""
-                                    field_2_str = str(field_2).strip() if pd.notna(field_2) else ""
-                                    
-                                    if expertise_str == field_1_str or expertise_str == field_2_str:
-                                        expertise_match = True
-                                        break
-                        elif pd.notna(expertise_value):
-                            # Single value - handle as before
-                            expertise_str = str(expertise_value).strip()
-                            field_1_str = str(field_1).strip() if pd.notna(field_1) else ""
-                            field_2_str = str(field_2).strip() if pd.notna(field_2) else ""
-                            
-                            if expertise_str == field_1_str or expertise_str == field_2_str:
-                                expertise_match = True
-                                break
-                        
-                        if expertise_match:
-                            break
-                
-                if expertise_match:
-                    matching_lecturers.append(lecturer_code)
+            # Check if lecturer's expertise matches either field_1 OR field_2
+            if self._expertise_matches(lecturer_code, targets):
+                matching_lecturers.append(lecturer_code)
         return np.array(matching_lecturers)
     
     def _rank_lecturer(self, temp_lect_pool, request, assigned_actors, round_num=1):
@@ -598,12 +657,10 @@ class ThesisScheduler:
         # Get consecutive available slots for each lecturer
         lecturer_consecutive_slots = []
         for lecturer_code in assigned_lecturer_codes:
-            lecturer_avail = self.dataframes['lecturer_availability'][
-                self.dataframes['lecturer_availability']['kode_dosen'] == lecturer_code
-            ]
+            avail_row = self._avail_row.get(lecturer_code)
             
-            if not lecturer_avail.empty:
-                lecturer_avail = lecturer_avail.iloc[0]
+            if avail_row is not None:
+                lecturer_avail = self.dataframes['lecturer_availability'].iloc[avail_row]
                 # Get available timeslots for this lecturer
                 available_slots = []
                 for time_col in time_columns:
@@ -621,7 +678,8 @@ class ThesisScheduler:
             common_availability = lecturer_consecutive_slots[0]
             for slots in lecturer_consecutive_slots[1:]:
                 common_availability = common_availability.intersection(slots)
-            return list(common_availability)
+            # Chronological, so callers taking the first slot get the earliest one
+            return sorted(common_availability, key=self._ts_idx.__getitem__)
         
         return []
 
@@ -649,7 +707,7 @@ class ThesisScheduler:
             start_slot = sorted_timeslots[i]
             
             for j in range(1, required_duration):
-                expected_next = self._get_next_timeslot(sorted_timeslots[i + j - 1])
+                expected_next = self._next_ts.get(sorted_timeslots[i + j - 1])
                 if expected_next != sorted_timeslots[i + j]:
                     is_consecutive = False
                     break
@@ -669,35 +727,39 @@ class ThesisScheduler:
         Returns:
             list: Chronologically sorted timeslot column names
         """
-        def parse_timeslot(timeslot):
-            if '_' in timeslot:
-                date_part, time_part = timeslot.split('_')
-                date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}"
-                time = f"{time_part[:2]}:{time_part[2:]}"
-                return pd.to_datetime(f"{date} {time}")
-            return pd.to_datetime('1900-01-01')  # Default for invalid format
-        
-        return sorted(timeslots, key=parse_timeslot)
+        return sorted(timeslots, key=self._ts_idx.__getitem__)
 
-    def _get_next_timeslot(self, current_timeslot):
+    def _window_availability(self, required_duration):
         """
-        Get the next 30-minute timeslot after the current one.
+        Get, for every lecturer and starting timeslot, whether the lecturer is available for
+        `required_duration` consecutive 30-minute slots starting there. Computed once per duration.
         
         Args:
-            current_timeslot (str): Current timeslot in format YYYYMMDD_HHMM
+            required_duration (int): Number of consecutive slots needed
             
         Returns:
-            str: Next timeslot in the same format
-        """
-        try:
-            if '_' in current_timeslot:
-                date_part, time_part = current_timeslot.split('_')
-                current_time = pd.to_datetime(f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]} {time_part[:2]}:{time_part[2:]}")
-                next_time = current_time + pd.Timedelta(minutes=30)
-                return f"{next_time.strftime('%Y%m%d')}_{next_time.strftime('%H%M')}"
-        except:
-            pass
-        return ""
+            numpy.ndarray: Boolean matrix (lecturer row x chronological timeslot)
+        """
+        if required_duration not in self._window_cache:
+            num_slots = len(self._ts_order)
+            num_bytes = (num_slots + 7) // 8
+            
+            # Start slots whose next (duration - 1) slots follow on consecutively
+            chained = -1
+            for offset in range(1, required_duration):
+                chained &= self._link_bits >> (offset - 1)
+            
+            # Shift-and each lecturer's bitmask so bit s stays set only if slots s..s+duration-1 are all available
+            window = np.zeros(self._avail.shape, dtype=bool)
+            for row_pos, bits in enumerate(self._avail_bits):
+                window_bits = bits & chained
+                for offset in range(1, required_duration):
+                    window_bits &= bits >> offset
+                if window_bits:
+                    packed = np.frombuffer(window_bits.to_bytes(num_bytes, 'little'), dtype=np.uint8)
+                    window[row_pos] = np.unpackbits(packed, bitorder='little')[:num_slots].astype(bool)
+            self._window_cache[required_duration] = window
+        return self._window_cache[required_duration]
 
     def _get_free_timeslots(self, assigned_availability, required_duration):
         """
@@ -725,7 +787,7 @@ class ThesisScheduler:
                 
                 # Move to next slot for next iteration
                 if slot_num < required_duration - 1:
-                    current_slot = self._get_next_timeslot(current_slot)
+                    current_slot = self._next_ts.get(current_slot)
                     if not current_slot:  # Invalid next slot
                         is_free_for_duration = False
                         break
@@ -735,6 +797,23 @@ class ThesisScheduler:
         
         return free_timeslots
 
+    def _get_assignment_id(self, assignment_name):
+        """
+        Get the integer id used for an assignment name in the slot owner mirror, registering it if new.
+        
+        Args:
+            assignment_name (str): Name written into the timeslot slot cells
+            
+        Returns:
+            int: Id of the assignment in self._assignment_names
+        """
+        assignment_id = self._assignment_ids.get(assignment_name)
+        if assignment_id is None:
+            assignment_id = len(self._assignment_names)
+            self._assignment_ids[assignment_name] = assignment_id
+            self._assignment_names.append(assignment_name)
+        return assignment_id
+
     def _is_timeslot_free(self, timeslot_col):
         """
         Check if a single timeslot is free in the timeslots dataframe.
@@ -745,31 +824,12 @@ class ThesisScheduler:
         Returns:
             bool: True if the timeslot has available slots
         """
-        if '_' in timeslot_col:
-            try:
-                date_part, time_part = timeslot_col.split('_')
-                formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}"
-                formatted_time = f"{time_part[:2]}:{time_part[2:]}"
-                
-                # Check if this timeslot is free in the timeslots dataframe
-                matching_timeslot = self.dataframes['timeslots'][
-                    (self.dataframes['timeslots']['date'] == formatted_date) & 
-                    (self.dataframes['timeslots']['time'] == formatted_time)
-                ]
-                
-                if not matching_timeslot.empty:
-                    # Check if any slot is available (value is 'none')
-                    slot_columns = [col for col in self.dataframes['timeslots'].columns 
-                                   if col.startswith('slot_')]
-                    row = matching_timeslot.iloc[0]
-                    
-                    # If any slot is 'none', this timeslot is available
-                    return any(row[slot_col] == 'none' for slot_col in slot_columns)
-                        
-            except Exception as e:
-                print(f"Error parsing timeslot {timeslot_col}: {e}")
-                
-        return False
+        row_idx = self._ts_row.get(timeslot_col)
+        if row_idx is None:
+            return False
+
+        # If any slot is 'none', this timeslot is available
+        return bool((self._slot_owner[row_idx] == -1).any())
 
     def _calculate_criteria_scores(self, lecturers_df, available_timeslots, required_duration, request, round_num=1):
         """
@@ -796,88 +856,62 @@ class ThesisScheduler:
         lecturers_df['expertise_match'] = False  # New column for expertise matching
         
         
-        # Calculate raw values for each criteria
-        for idx, row in lecturers_df.iterrows():
-            lecturer_code = row['kode_dosen']
-            
-            # Criteria A: Availability match with assigned actors (considering duration)
-            lecturer_avail = self.dataframes['lecturer_availability'][
-                self.dataframes['lecturer_availability']['kode_dosen'] == lecturer_code
-            ]
-            
-            if not lecturer_avail.empty:
-                lecturer_avail = lecturer_avail.iloc[0]
-                matches = 0
-                matched_slots = []
-                
-                for start_timeslot in available_timeslots:
-                    # Check if lecturer is available for the full duration starting from this slot
-                    is_available_for_duration = True
-                    current_slot = start_timeslot
-                    
-                    for slot_num in range(required_duration):
-                        if current_slot in lecturer_avail:
-                            if not (lecturer_avail[current_slot] == True or 
-                                   lecturer_avail[current_slot] == "TRUE" or 
-                                   lecturer_avail[current_slot] == "True"):
-                                is_available_for_duration = False
-                                break
-                        else:
-                            is_available_for_duration = False
-                            break
-                        
-                        # Move to next slot for next iteration
-                        if slot_num < required_duration - 1:
-                            current_slot = self._get_next_timeslot(current_slot)
-                            if not current_slot:
-                                is_available_for_duration = False
-                                break
-                    
-                    if is_available_for_duration:
-                        matches += 1
-                        matched_slots.append(start_timeslot)
-                
-                lecturers_df.at[idx, 'criteria_a_matches'] = matches
-                lecturers_df.at[idx, 'matched_timeslots'] = matched_slots
-                
-            
-            # Criteria B: Number of assignments
-            lecturer_info = self.dataframes['lecturers'][
-                self.dataframes['lecturers']['kode_dosen'] == lecturer_code
-            ]
-            if not lecturer_info.empty:
-                assignments = lecturer_info.iloc[0]['num_assignment']
-                lecturers_df.at[idx, 'criteria_b_assignments'] = assignments
-            
-            # Criteria C: Overall availability
-            if not lecturer_avail.empty:
-                availability_count = lecturer_avail['availability_count']
-                lecturers_df.at[idx, 'criteria_c_availability'] = availability_count
-            
-            # Check expertise match for Round 2 bonus
-            if round_num == 2:
-                expertise_match = self._check_lecturer_expertise_match(lecturer_code, request)
-                lecturers_df.at[idx, 'expertise_match'] = expertise_match
+        # All criteria are computed for the whole candidate pool in one pass. Criteria A comes from
+        # the duration's precomputed availability windows, shared by every request of the same duration
+        window = self._window_availability(required_duration)
+        start_positions = np.array([self._ts_idx[timeslot] for timeslot in available_timeslots], dtype=int)
+        lecturer_codes = lecturers_df['kode_dosen'].tolist()
+        avail_rows = np.array([self._avail_row.get(code, -1) for code in lecturer_codes], dtype=int)
+        has_avail = avail_rows >= 0
+        start_matches = window[avail_rows][:, start_positions] & has_avail[:, None]
+        
+        # Criteria A: Availability match with assigned actors (considering duration)
+        matched_timeslots = np.empty(len(lecturer_codes), dtype=object)
+        for pos in np.flatnonzero(has_avail):
+            matched_timeslots[pos] = start_positions[start_matches[pos]].astype(np.int32)
+        lecturers_df['criteria_a_matches'] = start_matches.sum(axis=1)
+        lecturers_df['matched_timeslots'] = matched_timeslots
+        
+        # Filter out lecturers with no availability matches (criteria_a_matches = 0) before
+        # computing the remaining criteria, so they're only evaluated for possible candidates
+        survivors = lecturers_df['criteria_a_matches'].to_numpy() > 0
+        lecturers_df = lecturers_df[survivors].reset_index(drop=True)
+        lecturer_codes = lecturers_df['kode_dosen'].tolist()
+        avail_rows = avail_rows[survivors]
+        
+        # Criteria B: Number of assignments
+        num_assignment = self.dataframes['lecturers']['num_assignment']
+        lecturers_df['criteria_b_assignments'] = [
+            num_assignment.at[self._lect_row[code]] if code in self._lect_row else 0 for code in lecturer_codes
+        ]
         
-        # Filter out lecturers with no availability matches (criteria_a_matches = 0)
-        lecturers_df = lecturers_df[lecturers_df['criteria_a_matches'] > 0].reset_index(drop=True)
+        # Criteria C: Overall availability
+        lecturers_df['criteria_c_availability'] = self._avail_count[avail_rows]
+        
+        # Check expertise match for Round 2 bonus
+        if round_num == 2:
+            lecturers_df['expertise_match'] = [
+                self._check_lecturer_expertise_match(code, request) for code in lecturer_codes
+            ]
         
         # Only calculate scores if we have remaining lecturers
         if not lecturers_df.empty:
             # Calculate scores using ranking (higher score = better candidate)
             # For criteria A: More matches = worse (lower score)
-            lecturers_df['criteria_a_score'] = lecturers_df['criteria_a_matches'].rank(method='max', ascending=False)
+            criteria_a_score = _rank_descending(lecturers_df['criteria_a_matches'].to_numpy(), method='max')
             
             # For criteria B: Fewer assignments = better (higher score)  
-            lecturers_df['criteria_b_score'] = lecturers_df['criteria_b_assignments'].rank(method='min', ascending=False)
+            criteria_b_score = _rank_descending(lecturers_df['criteria_b_assignments'].to_numpy(), method='min')
             
             # For criteria C: Less overall availability = better (higher score) - prioritize busy lecturers
-            lecturers_df['criteria_c_score'] = lecturers_df['criteria_c_availability'].rank(method='min', ascending=False)
+            criteria_c_score = _rank_descending(lecturers_df['criteria_c_availability'].to_numpy(), method='min')
+            
+            lecturers_df['criteria_a_score'] = criteria_a_score
+            lecturers_df['criteria_b_score'] = criteria_b_score
+            lecturers_df['criteria_c_score'] = criteria_c_score
             
             # Calculate total score
-            lecturers_df['total_score'] = (lecturers_df['criteria_a_score'] + 4 *
-                                          lecturers_df['criteria_b_score'] + 
-                                          lecturers_df['criteria_c_score'])
+            lecturers_df['total_score'] = criteria_a_score + 4 * criteria_b_score + criteria_c_score
             
             # Apply expertise bonus for Round 2
             if round_num == 2:
@@ -901,6 +935,7 @@ class ThesisScheduler:
         # Convert start time to minutes for calculation
         start_hour, start_minute = map(int, start_time.split(':'))
         start_minutes = start_hour * 60 + start_minute
+        date_key = start_date.replace('-', '')
         
         slots_assigned = 0
         current_minutes = start_minutes
@@ -909,31 +944,27 @@ class ThesisScheduler:
             # Calculate current slot time
             current_hour = current_minutes // 60
             current_min = current_minutes % 60
-            current_time_str = f"{current_hour:02d}:{current_min:02d}"
             
             # Find matching timeslot row
-            timeslot_mask = ((self.dataframes['timeslots']['date'] == start_date) & 
-                           (self.dataframes['timeslots']['time'] == current_time_str))
+            row_idx = self._ts_row.get(f"{date_key}_{current_hour:02d}{current_min:02d}")
             
-            if timeslot_mask.any():
-                slot_columns = [col for col in self.dataframes['timeslots'].columns if col.startswith('slot_')]
-                row_idx = self.dataframes['timeslots'][timeslot_mask].index[0]
-                
+            if row_idx is not None:
                 # Find first available slot and assign
                 slot_assigned = False
-                for slot_col in slot_columns:
-                    if self.dataframes['timeslots'].loc[row_idx, slot_col] == 'none':
-                        self.dataframes['timeslots'].loc[row_idx, slot_col] = assignment_name
-                        slots_assigned += 1
-                        slot_assigned = True
-                        print(f"Updated timeslot {start_date} {current_time_str} ({slot_col}) with {assignment_name}")
-                        break
+                free_slots = np.flatnonzero(self._slot_owner[row_idx] == -1)
+                if len(free_slots) > 0:
+                    slot_col = self._slot_columns[free_slots[0]]
+                    self.dataframes['timeslots'].loc[row_idx, slot_col] = assignment_name
+                    self._slot_owner[row_idx, free_slots[0]] = self._get_assignment_id(assignment_name)
+                    slots_assigned += 1
+                    slot_assigned = True
+                    logger.debug("Updated timeslot %s %02d:%02d (%s) with %s", start_date, current_hour, current_min, slot_col, assignment_name)
                 
                 if not slot_assigned:
-                    print(f"Warning: No available slot found for {start_date} {current_time_str}")
+                    logger.warning("No available slot found for %s %02d:%02d", start_date, current_hour, current_min)
                     break
             else:
-                print(f"Warning: Timeslot not found for {start_date} {current_time_str}")
+                logger.warning("Timeslot not found for %s %02d:%02d", start_date, current_hour, current_min)
                 break
             
             # Move to next 30-minute slot
@@ -946,6 +977,22 @@ class ThesisScheduler:
         Determine the timeslot needed for a request based on whether it's a capstone project or not,
         and the type of event (Proposal vs Sidang Akhir).
         
+        Args:
+            request_id: Single student ID (str) or list of student IDs for capstone projects
+            
+        Returns:
+            int: The timeslot duration needed for this request
+        """
+        # Request type and group size don't change while scheduling, so compute once per request
+        cache_key = request_id if isinstance(request_id, str) else tuple(request_id)
+        if cache_key not in self._timeslot_needed_cache:
+            self._timeslot_needed_cache[cache_key] = self._compute_timeslot_needed(request_id)
+        return self._timeslot_needed_cache[cache_key]
+
+    def _compute_timeslot_needed(self, request_id):
+        """
+        Compute the timeslot duration for a request (uncached version of `_check_timeslot_needed`).
+        
         Args:
             request_id: Single student ID (str) or list of student IDs for capstone projects
             
@@ -956,26 +1003,22 @@ class ThesisScheduler:
         # We need to find the request row to get the type
         if isinstance(request_id, str):
             # Single student - find the request row
-            request_row = self.dataframes['request'][
-                self.dataframes['request']['nim'] == request_id
-            ]
+            row_idx = self._nim_row.get(request_id)
         else:
             # Capstone project - use the first student to get the type
-            request_row = self.dataframes['request'][
-                self.dataframes['request']['nim'] == request_id[0]
-            ]
+            row_idx = self._nim_row.get(request_id[0])
         
-        if request_row.empty:
+        if row_idx is None:
             # Fallback to default if request not found
-            return int(self.config['default_timeslot'])
+            return self._durations['default_timeslot']
         
-        request_type = request_row.iloc[0].get('type', 'Proposal')  # Default to Proposal if type not found
+        request_type = self.dataframes['request'].loc[row_idx].get('type', 'Proposal')  # Default to Proposal if type not found
         
         if isinstance(request_id, str):  # Single student (not a capstone project)
             if request_type == 'Sidang Akhir':
-                return int(self.config['default_timeslot_sidang'])
+                return self._durations['default_timeslot_sidang']
             else:  # Proposal or any other type
-                return int(self.config['default_timeslot'])
+                return self._durations['default_timeslot']
         else:  # Capstone project (list of student IDs)
             # Get number of students in the capstone group
             num_students = len(request_id)
@@ -984,25 +1027,25 @@ class ThesisScheduler:
             if request_type == 'Sidang Akhir':
                 # Use sidang configurations
                 if num_students == 2:
-                    return int(self.config['capstone_duration_sidang_2'])
+                    return self._durations['capstone_duration_sidang_2']
                 elif num_students == 3:
-                    return int(self.config['capstone_duration_sidang_3'])
+                    return self._durations['capstone_duration_sidang_3']
                 elif num_students == 4:
-                    return int(self.config['capstone_duration_sidang_4'])
+                    return self._durations['capstone_duration_sidang_4']
                 else:
                     # Default to single student sidang timeslot for other numbers
-                    return int(self.config['default_timeslot_sidang'])
+                    return self._durations['default_timeslot_sidang']
             else:
                 # Use proposal configurations (default)
                 if num_students == 2:
-                    return int(self.config['capstone_duration_2'])
+                    return self._durations['capstone_duration_2']
                 elif num_students == 3:
-                    return int(self.config['capstone_duration_3'])
+                    return self._durations['capstone_duration_3']
                 elif num_students == 4:
-                    return int(self.config['capstone_duration_4'])
+                    return self._durations['capstone_duration_4']
                 else:
                     # Default to single student proposal timeslot for other numbers
-                    return int(self.config['default_timeslot'])
+                    return self._durations['default_timeslot']
 
     def _check_capstone(self, request):
         """
@@ -1022,9 +1065,7 @@ class ThesisScheduler:
         if pd.notna(request.get('capstone_code')):
             capstone_status = request['capstone_code']
             # Get all rows with the same capstone group
-            same_group_requests = self.dataframes['request'][
-                self.dataframes['request']['capstone_code'] == capstone_status
-            ]
+            same_group_requests = self.dataframes['request'].iloc[self._capstone_rows(capstone_status)]
             
             # Verify integrity of capstone group data
             self._verify_capstone_integrity(same_group_requests, capstone_status)
@@ -1036,6 +1077,32 @@ class ThesisScheduler:
 
         return capstone_status, request_id
     
+    def _capstone_rows(self, capstone_code):
+        """
+        Get the row positions of all requests in a capstone group.
+        
+        Args:
+            capstone_code (str): The capstone group identifier
+            
+        Returns:
+            numpy.ndarray: Positions of the group's rows in the request dataframe
+        """
+        return self._capstone_groups.get(capstone_code, np.empty(0, dtype=np.intp))
+
+    def _capstone_mask(self, capstone_code):
+        """
+        Get a boolean mask over the request rows selecting a capstone group.
+        
+        Args:
+            capstone_code (str): The capstone group identifier
+            
+        Returns:
+            numpy.ndarray: Boolean mask, True for the group's rows
+        """
+        group_mask = np.zeros(len(self.dataframes['request']), dtype=bool)
+        group_mask[self._capstone_rows(capstone_code)] = True
+        return group_mask
+
     def _verify_capstone_integrity(self, group_requests, capstone_code):
         """
         Verify that all members of a capstone group have consistent actor and field assignments.
@@ -1049,27 +1116,32 @@ class ThesisScheduler:
         """
         fields_to_check = ['spv_1', 'spv_2', 'examiner_1', 'examiner_2', 'field_1', 'field_2']
         
-        # Get the first row as reference
-        reference_row = group_requests.iloc[0]
-        
-        # Check each field for consistency across all group members
-        for field in fields_to_check:
-            reference_value = reference_row[field]
-            
-            # Check if all values in this field are the same (handling NaN values)
-            field_values = group_requests[field]
-            
-            # Use pandas comparison that handles NaN properly
-            if not (field_values.isna().all() or 
-                   (field_values.notna() & (field_values == reference_value)).all() or
-                   field_values.isna().equals(reference_row[field] if pd.isna(reference_value) else pd.Series([False] * len(field_values)))):
-                
-                inconsistent_values = field_values.unique()
-                raise ValueError(
-                    f"Capstone group '{capstone_code}' has inconsistent '{field}' values: {inconsistent_values}. "
-                    f"All members must have the same {field} assignment."
-                )
+        # Count distinct values per field in one pass. Missing values (NaN/NaT/None) are
+        # normalized first so they count as a single value
+        field_values = group_requests[fields_to_check]
+        field_values = field_values.where(field_values.notna())
+        inconsistent = field_values.nunique(dropna=False) > 1
+        
+        if inconsistent.any():
+            field = inconsistent[inconsistent].index[0]
+            inconsistent_values = group_requests[field].unique()
+            raise ValueError(
+                f"Capstone group '{capstone_code}' has inconsistent '{field}' values: {inconsistent_values}. "
+                f"All members must have the same {field} assignment."
+            )
     
+    def _sync_pending_examiners(self, row_mask):
+        """
+        Refresh the pending-examiner mask for the request rows whose examiners were just written.
+        
+        Args:
+            row_mask (pandas.Series or numpy.ndarray): Boolean mask over the request rows
+        """
+        positions = np.flatnonzero(row_mask)
+        self._pending_examiner_mask[positions] = (
+            self.dataframes['request'].iloc[positions][['examiner_1', 'examiner_2']].isna().to_numpy()
+        )
+
     def _check_list_actor(self, request):
         """
         Check and categorize actors (supervisors and examiners) based on their assignment status.
@@ -1088,10 +1160,13 @@ class ThesisScheduler:
         Note:
             - Supervisors ('spv_1', 'spv_2') are checked for assignment status only
             - Examiners ('examiner_1', 'examiner_2') are checked for unassigned status only
-            - Uses pandas.notna() and pandas.isna() for null value checking
+            - Examiner status is read from the precomputed pending-examiner mask by row
         """
         assigned_actor = []
         to_be_assigned_actor = []
+        pending_exam_1, pending_exam_2 = self._pending_examiner_mask[
+            self.dataframes['request'].index.get_loc(request.name)
+        ]
 
         # Check supervisors
         if pd.notna(request['spv_1']):
@@ -1100,11 +1175,11 @@ class ThesisScheduler:
         if pd.notna(request['spv_2']):
             assigned_actor.append('spv_2')
         # Check examiners. If already specified (pre-assigned), treat them as assigned so they won't be replaced.
-        if pd.notna(request.get('examiner_1')):
+        if not pending_exam_1:
             assigned_actor.append('examiner_1')
         else:
             to_be_assigned_actor.append('examiner_1')
-        if pd.notna(request.get('examiner_2')):
+        if not pending_exam_2:
             assigned_actor.append('examiner_2')
         else:
             to_be_assigned_actor.append('examiner_2')
@@ -1224,12 +1299,13 @@ class ThesisScheduler:
                 self.dataframes['request'].loc[df_mask, 'examiner_1'] = pd.NaT
             if not preserve_exam_2:
                 self.dataframes['request'].loc[df_mask, 'examiner_2'] = pd.NaT
+            self._sync_pending_examiners(df_mask)
             self.dataframes['request'].loc[df_mask, 'date_time'] = pd.NaT
             self.dataframes['request'].loc[df_mask, 'status'] = pd.NaT
 
         # Reset request dataframe (avoid clearing preserved examiners)
         if request_type == 'capstone' and capstone_code:
-            group_mask = self.dataframes['request']['capstone_code'] == capstone_code
+            group_mask = self._capstone_mask(capstone_code)
             _maybe_clear(group_mask)
         else:
             request_mask = self.dataframes['request']['nim'] == nim
@@ -1259,18 +1335,16 @@ class ThesisScheduler:
         
         # Revert lecturer assignments
         for examiner_code in assigned_examiners:
-            lecturer_mask = self.dataframes['lecturers']['kode_dosen'] == examiner_code
+            lecturer_idx = self._lect_row.get(examiner_code)
             
-            if lecturer_mask.any():
-                lecturer_idx = self.dataframes['lecturers'][lecturer_mask].index[0]
-                current_used = self.dataframes['lecturers'].loc[lecturer_idx, 'used_timeslot']
+            if lecturer_idx is not None:
+                current_used = self.dataframes['lecturers'].at[lecturer_idx, 'used_timeslot']
                 
-                # Remove the assigned datetime from used_timeslot list
-                if isinstance(current_used, list) and assigned_datetime in current_used:
-                    updated_used = [slot for slot in current_used if slot != assigned_datetime]
-                    self.dataframes['lecturers'].at[lecturer_idx, 'used_timeslot'] = updated_used
-                    self.dataframes['lecturers'].at[lecturer_idx, 'num_assignment'] = len(updated_used)
-                    print(f"Reverted lecturer {examiner_code}: assignments={len(updated_used)}")
+                # Remove the assigned datetime from used_timeslot set
+                if assigned_datetime in current_used:
+                    current_used.discard(assigned_datetime)
+                    self.dataframes['lecturers'].at[lecturer_idx, 'num_assignment'] = len(current_used)
+                    print(f"Reverted lecturer {examiner_code}: assignments={len(current_used)}")
         
         print(f"Reset partial assignment for request {nim}")
 
@@ -1287,31 +1361,29 @@ class ThesisScheduler:
         # Convert start time to minutes for calculation
         start_hour, start_minute = map(int, start_time.split(':'))
         start_minutes = start_hour * 60 + start_minute
+        date_key = start_date.replace('-', '')
         
         slots_reverted = 0
         current_minutes = start_minutes
+        assignment_id = self._assignment_ids.get(assignment_name)
         
         for slot_num in range(duration):
             # Calculate current slot time
             current_hour = current_minutes // 60
             current_min = current_minutes % 60
-            current_time_str = f"{current_hour:02d}:{current_min:02d}"
             
             # Find matching timeslot row
-            timeslot_mask = ((self.dataframes['timeslots']['date'] == start_date) & 
-                           (self.dataframes['timeslots']['time'] == current_time_str))
+            row_idx = self._ts_row.get(f"{date_key}_{current_hour:02d}{current_min:02d}")
             
-            if timeslot_mask.any():
-                slot_columns = [col for col in self.dataframes['timeslots'].columns if col.startswith('slot_')]
-                row_idx = self.dataframes['timeslots'][timeslot_mask].index[0]
-                
+            if row_idx is not None and assignment_id is not None:
                 # Find and revert slots assigned to this assignment
-                for slot_col in slot_columns:
-                    if self.dataframes['timeslots'].loc[row_idx, slot_col] == assignment_name:
-                        self.dataframes['timeslots'].loc[row_idx, slot_col] = 'none'
-                        slots_reverted += 1
-                        print(f"Reverted timeslot {start_date} {current_time_str} ({slot_col})")
-                        break
+                owned_slots = np.flatnonzero(self._slot_owner[row_idx] == assignment_id)
+                if len(owned_slots) > 0:
+                    slot_col = self._slot_columns[owned_slots[0]]
+                    self.dataframes['timeslots'].loc[row_idx, slot_col] = 'none'
+                    self._slot_owner[row_idx, owned_slots[0]] = -1
+                    slots_reverted += 1
+                    logger.debug("Reverted timeslot %s %02d:%02d (%s)", start_date, current_hour, current_min, slot_col)
             
             # Move to next 30-minute slot
             current_minutes += 30
@@ -1329,47 +1401,56 @@ class ThesisScheduler:
         Returns:
             bool: True if lecturer's expertise matches any of the request fields
         """
-        # Get lecturer row
-        lecturer_row = self.dataframes['lecturers'][
-            self.dataframes['lecturers']['kode_dosen'] == lecturer_code
-        ]
-        
-        if lecturer_row.empty:
-            return False
-        
-        lecturer_row = lecturer_row.iloc[0]
         field_1 = request['field_1']
         field_2 = request['field_2']
         
-        # Find expertise columns dynamically
-        expertise_columns = [col for col in self.dataframes['lecturers'].columns if 'expertise' in col.lower()]
-        
         # Check if lecturer's expertise matches either field_1 OR field_2
-        for expertise_col in expertise_columns:
-            if expertise_col in lecturer_row:
-                expertise_value = lecturer_row[expertise_col]
-                
-                # Handle different types of expertise values
-                if isinstance(expertise_value, (list, np.ndarray)):
-                    # If it's a list/array, check each element
-                    for expertise_item in expertise_value:
-                        if pd.notna(expertise_item):
-                            expertise_str = str(expertise_item).strip()
-                            field_1_str = str(field_1).strip() if pd.notna(field_1) else ""
-                            field_2_str = str(field_2).strip() if pd.notna(field_2) else ""
-                            
-                            if expertise_str == field_1_str or expertise_str == field_2_str:
-                                return True
-                elif pd.notna(expertise_value):
-                    # Single value
-                    expertise_str = str(expertise_value).strip()
-                    field_1_str = str(field_1).strip() if pd.notna(field_1) else ""
-                    field_2_str = str(field_2).strip() if pd.notna(field_2) else ""
-                    
-                    if expertise_str == field_1_str or expertise_str == field_2_str:
-                        return True
+        return self._expertise_matches(lecturer_code, self._field_targets(field_1, field_2))
+
+    def _field_targets(self, field_1, field_2):
+        """
+        Get the set of field names a lecturer's expertise can match, stripped once.
+        
+        Args:
+            field_1 (str): First field requirement
+            field_2 (str): Second field requirement
+            
+        Returns:
+            set: Non-empty stripped field names
+        """
+        return {str(field).strip() for field in (field_1, field_2) if pd.notna(field)} - {''}
+
+    def _expertise_matches(self, lecturer_code, targets):
+        """
+        Check if any of a lecturer's expertise values is one of the target fields.
+        
+        Args:
+            lecturer_code (str): Code of the lecturer to check
+            targets (set): Field names from _field_targets
+            
+        Returns:
+            bool: True if the lecturer's expertise and the targets intersect
+        """
+        return not targets.isdisjoint(self._lecturer_expertise.get(lecturer_code, ()))
+
+    def _collect_expertise(self, lecturer_record):
+        """
+        Gather all expertise values of a lecturer (list/array cells or single values).
         
-        return False
+        Args:
+            lecturer_record (dict): Expertise columns of one lecturer row
+            
+        Returns:
+            set: Stripped expertise values
+        """
+        expertise_values = set()
+        for expertise_value in lecturer_record.values():
+            if isinstance(expertise_value, (list, np.ndarray)):
+                expertise_values.update(str(item).strip() for item in expertise_value if pd.notna(item))
+            elif pd.notna(expertise_value):
+                expertise_values.add(str(expertise_value).strip())
+        
+        return expertise_values
 
     def _run_round_3_scheduling(self):
         """
@@ -1424,10 +1505,7 @@ class ThesisScheduler:
                 if capstone_status:
                     # Update all group members
                     capstone_code = request['capstone_code']
-                    capstone_requests = self.dataframes['request'][
-                        self.dataframes['request']['capstone_code'] == capstone_code
-                    ]
-                    for cap_index in capstone_requests.index:
+                    for cap_index in self.dataframes['request'].index[self._capstone_rows(capstone_code)]:
                         self.dataframes['request'].at[cap_index, 'date_time'] = earliest_available_time
                         self.dataframes['request'].at[cap_index, 'status'] = 'Scheduled - Round 3'
                 else:
@@ -1495,15 +1573,13 @@ class ThesisScheduler:
             # Check if all actors are available for all consecutive slots
             all_actors_available = True
             for actor_code in all_involved_actors:
-                actor_row = self.dataframes['lecturer_availability'][
-                    self.dataframes['lecturer_availability']['kode_dosen'] == actor_code
-                ]
+                actor_avail_row = self._avail_row.get(actor_code)
                 
-                if actor_row.empty:
+                if actor_avail_row is None:
                     all_actors_available = False
                     break
                 
-                actor_row = actor_row.iloc[0]
+                actor_row = self.dataframes['lecturer_availability'].iloc[actor_avail_row]
                 
                 # Check availability for all consecutive slots
                 for slot in consecutive_slots:
@@ -1632,23 +1708,20 @@ class ThesisScheduler:
                 if pd.notna(request.get('capstone_code')):
                     # Update all capstone group members
                     capstone_code = request['capstone_code']
-                    capstone_requests = self.dataframes['request'][
-                        self.dataframes['request']['capstone_code'] == capstone_code
-                    ]
-                    for cap_index in capstone_requests.index:
+                    for cap_index in self.dataframes['request'].index[self._capstone_rows(capstone_code)]:
                         self.dataframes['request'].at[cap_index, actor_role] = examiner_codes[i]
+                    self._sync_pending_examiners(self._capstone_mask(capstone_code))
                 else:
                     self.dataframes['request'].at[request_index, actor_role] = examiner_codes[i]
+                    self._sync_pending_examiners(self.dataframes['request'].index == request_index)
         
         # Update lecturer assignments
         for examiner_code in examiner_codes:
-            lecturer_idx = self.dataframes['lecturers'][
-                self.dataframes['lecturers']['kode_dosen'] == examiner_code
-            ].index[0]
+            lecturer_idx = self._lect_row[examiner_code]
             
             current_assignments = self.dataframes['lecturers'].at[lecturer_idx, 'num_assignment']
             self.dataframes['lecturers'].at[lecturer_idx, 'num_assignment'] = current_assignments + 1
-            self.dataframes['lecturers'].at[lecturer_idx, 'used_timeslot'] = assigned_time
+            self.dataframes['lecturers'].at[lecturer_idx, 'used_timeslot'].add(assigned_time)
         
         print(f"Round 3: Successfully assigned examiners {examiner_codes} for time {assigned_time}")
         return True
@@ -1665,14 +1738,12 @@ class ThesisScheduler:
         Returns:
             bool: True if lecturer is available for the full duration
         """
-        lecturer_row = self.dataframes['lecturer_availability'][
-            self.dataframes['lecturer_availability']['kode_dosen'] == lecturer_code
-        ]
+        avail_row = self._avail_row.get(lecturer_code)
         
-        if lecturer_row.empty:
+        if avail_row is None:
             return False
         
-        lecturer_row = lecturer_row.iloc[0]
+        lecturer_row = self.dataframes['lecturer_availability'].iloc[avail_row]
         
         # Generate consecutive timeslot names
         date_part, time_part = start_timeslot.split('_')
@@ -1720,12 +1791,10 @@ class ThesisScheduler:
             lecturer_code = row['kode_dosen']
             
             # Get number of current assignments
-            lecturer_row = self.dataframes['lecturers'][
-                self.dataframes['lecturers']['kode_dosen'] == lecturer_code
-            ]
+            lecturer_idx = self._lect_row.get(lecturer_code)
             
-            if not lecturer_row.empty:
-                num_assignments = lecturer_row.iloc[0]['num_assignment']
+            if lecturer_idx is not None:
+                num_assignments = self.dataframes['lecturers'].at[lecturer_idx, 'num_assignment']
                 ranked_df.at[idx, 'num_assignments'] = num_assignments
             
             # Check expertise match
@@ -1,3 +1,4 @@
+import heapq
 import pandas as pd
 import numpy as np
 from collections import defaultdict
@@ -8,9 +9,8 @@ class ThesisScheduler:
         self.dataframes = dataframes
         self.config = config
         self.lecturer_assignments = defaultdict(int)  # Track number of assignments per lecturer
+        self._results = []  # (request index, date_time, examiner_1, examiner_2), written back at the end of run()
         self.capstone_groups = {}  # Track capstone groups and their assignments
-        self.scheduled_timeslots = set()  # Track used timeslots
-        self.lecturer_timeslot_assignments = defaultdict(set)  # Track lecturer assignments per timeslot
         
         # Parse capstone duration from config
         self.capstone_duration = {}
@@ -29,6 +29,60 @@ class ThesisScheduler:
         
         self.default_timeslot = int(config.get('default_timeslot', 2))
         self.parallel_event = int(config.get('parallel_event', 1))
+        
+        # Lecturer availability as a boolean matrix (lecturer x timeslot column) with index maps,
+        # so an availability check is a single array lookup instead of a dataframe scan
+        lecturer_availability = self.dataframes['lecturer_availability']
+        self._time_cols = sorted(col for col in lecturer_availability.columns
+                                 if col not in ['kode_dosen', 'availability_count'])
+        self._time_idx = {col: i for i, col in enumerate(self._time_cols)}
+        # Timeslot column names (YYYYMMDD_HHMM) parsed once: date part and minute of the day
+        self._slot_date = np.array([col[:8] for col in self._time_cols])
+        self._slot_minute = np.array([int(col[9:11]) * 60 + int(col[11:13]) for col in self._time_cols])
+        # Whether each timeslot column is followed directly by the one 30 minutes later on the same date
+        slot_times = pd.to_datetime(pd.Series(self._time_cols, dtype=object), format='%Y%m%d_%H%M').to_numpy()
+        self._next_is_consecutive = ((np.diff(slot_times) == np.timedelta64(30, 'm')) &
+                                     (self._slot_date[1:] == self._slot_date[:-1]))
+        # Start columns whose next k - 1 steps stay consecutive, keyed by k (fixed for the whole run)
+        self._consecutive_windows = {}
+        self._lec_idx = {}
+        for i, code in enumerate(lecturer_availability['kode_dosen']):
+            self._lec_idx.setdefault(code, i)
+        self._avail = lecturer_availability[self._time_cols].isin([True, 'TRUE', 'true']).to_numpy(dtype=bool)
+        # Same shape, marks timeslots a lecturer is already assigned to (lecturer x timeslot)
+        self._conflict = np.zeros(self._avail.shape, dtype=bool)
+        # Timeslot columns used by at least one scheduled defense
+        self._scheduled = np.zeros(len(self._time_cols), dtype=bool)
+        
+        # Parallel slot columns of the timeslots dataframe
+        self._slot_cols = [col for col in self.dataframes['timeslots'].columns if col.startswith('slot_')]
+        
+        # Row of each (date, time) pair in the timeslots dataframe
+        self._ts_row_of = {}
+        for row_idx, date, time in self.dataframes['timeslots'][['date', 'time']].itertuples():
+            self._ts_row_of.setdefault((date, time), row_idx)
+        
+        # Occupied parallel slots per timeslot column; columns without a timeslots row have no capacity
+        self._parallel_count = np.full(len(self._time_cols), self.parallel_event, dtype=np.int32)
+        slot_values = self.dataframes['timeslots'][self._slot_cols].to_numpy()
+        for time_idx, (date_part, minute) in enumerate(zip(self._slot_date, self._slot_minute)):
+            formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}"
+            formatted_time = f"{minute // 60:02d}:{minute % 60:02d}"
+            row_idx = self._ts_row_of.get((formatted_date, formatted_time))
+            if row_idx is not None:
+                row_pos = self.dataframes['timeslots'].index.get_loc(row_idx)
+                self._parallel_count[time_idx] = np.count_nonzero(slot_values[row_pos] != 'none')
+        
+        # Inverted index expertise -> lecturer codes, plus each lecturer's position in the
+        # lecturers table so pools keep the table order
+        self._by_expertise = defaultdict(set)
+        self._lecturer_order = {}
+        for position, (lecturer_code, expertise_list) in enumerate(
+                zip(self.dataframes['lecturers']['kode_dosen'], self.dataframes['lecturers']['expertise'])):
+            self._lecturer_order.setdefault(lecturer_code, position)
+            if isinstance(expertise_list, list):
+                for expertise in expertise_list:
+                    self._by_expertise[expertise].add(lecturer_code)
     
     def run(self):
         """Main scheduling method using chronological order"""
@@ -37,9 +91,12 @@ class ThesisScheduler:
         # Process capstone groups
         self._process_capstone_groups()
         
-        # Get request list in chronological order (by index)
-        request_list = list(self.dataframes['request'].iterrows())
-        request_list.sort(key=lambda x: x[0])  # Sort by index (chronological order)
+        # Get request list in chronological order (by index), sorting only if the index isn't ordered yet.
+        # Rows are plain dicts, which support the same .get() access as a Series
+        request_df = self.dataframes['request']
+        if not request_df.index.is_monotonic_increasing:
+            request_df = request_df.sort_index(kind='stable')
+        request_list = list(zip(request_df.index, request_df.to_dict('records')))
         
         scheduled_count = 0
         total_count = len(request_list)
@@ -47,29 +104,32 @@ class ThesisScheduler:
         # Process each request in chronological order
         for index, request_row in request_list:
             try:
-                # Check if already scheduled (for capstone groups)
+                # Check if already scheduled (for capstone groups). Only the group's first scheduled
+                # member goes through _schedule_request; the rest reuse its slot and lecturers
                 capstone_code = request_row.get('capstone_code', '')
                 if pd.notna(capstone_code) and capstone_code != '':
-                    if self.capstone_groups.get(capstone_code, {}).get('assigned_slot'):
+                    group = self.capstone_groups.get(capstone_code, {})
+                    if group.get('assigned_slot'):
                         # Already scheduled as part of capstone group, just update
-                        timeslot = self.capstone_groups[capstone_code]['assigned_slot']
-                        assigned_lecturers = self.capstone_groups[capstone_code]['assigned_lecturers']
-                        self._update_request_dataframe(index, assigned_lecturers, timeslot)
+                        self._update_request_dataframe(index, group['assigned_lecturers'], group['assigned_slot'])
+                        print(f"✓ Updated capstone member {request_row.get('nim', 'Unknown')} with existing schedule at {group['assigned_slot']}")
                         scheduled_count += 1
                         continue
                 
                 # Try to schedule the request
+                results_before = len(self._results)
                 self._schedule_request(request_row, index)
                 
                 # Check if successfully scheduled
-                new_status = self.dataframes['request'].loc[index, 'status']
-                if new_status == 'Field and Time Matching':
+                if len(self._results) > results_before:
                     scheduled_count += 1
                     
             except Exception as e:
                 print(f"  Error scheduling request {index}: {e}")
                 continue
         
+        self._write_results()
+        
         success_rate = scheduled_count / total_count if total_count > 0 else 0
         print(f"\n✓ Chronological scheduling completed")
         
@@ -79,12 +139,15 @@ class ThesisScheduler:
         """Process and validate capstone groups"""
         capstone_groups = {}
         
-        for index, row in self.dataframes['request'].iterrows():
-            capstone_code = row.get('capstone_code', '')
+        # Walk the needed columns directly instead of building a Series per row
+        request_df = self.dataframes['request']
+        
+        def column(name):
+            return request_df[name].to_numpy() if name in request_df.columns else [''] * len(request_df)
+        
+        for index, capstone_code, field_1, field_2 in zip(
+                request_df.index, column('capstone_code'), column('field_1'), column('field_2')):
             if pd.notna(capstone_code) and capstone_code != '':
-                field_1 = row.get('field_1', '')
-                field_2 = row.get('field_2', '')
-                
                 if capstone_code not in capstone_groups:
                     capstone_groups[capstone_code] = {
                         'field_1': field_1,
@@ -101,22 +164,18 @@ class ThesisScheduler:
                 
                 capstone_groups[capstone_code]['members'].append(index)
         
+        # Slots needed by each group, determined once from its number of members
+        for group in capstone_groups.values():
+            group['required_slots'] = self.capstone_duration.get(str(len(group['members'])), self.default_timeslot)
+        
         self.capstone_groups = capstone_groups
     
     def _schedule_request(self, request_row, request_index):
         """Schedule a single request"""
         print(f"Scheduling request {request_index}: {request_row.get('nim', 'Unknown')}")
         
-        # Check if this is part of a capstone group
+        # Members of an already scheduled capstone group are handled in run() before getting here
         capstone_code = request_row.get('capstone_code', '')
-        if pd.notna(capstone_code) and capstone_code != '':
-            if self.capstone_groups[capstone_code]['assigned_slot']:
-                # Already scheduled as part of capstone group, update this member's info
-                timeslot = self.capstone_groups[capstone_code]['assigned_slot']
-                assigned_lecturers = self.capstone_groups[capstone_code]['assigned_lecturers']
-                self._update_request_dataframe(request_index, assigned_lecturers, timeslot)
-                print(f"✓ Updated capstone member {request_row.get('nim', 'Unknown')} with existing schedule at {timeslot}")
-                return
         
         # Step 3: Create examiner pool
         examiner_pool = self._create_examiner_pool(request_row)
@@ -154,11 +213,25 @@ class ThesisScheduler:
         except:
             formatted_datetime = timeslot
         
-        # Update the request dataframe with assigned information using existing columns
-        self.dataframes['request'].loc[request_index, 'date_time'] = formatted_datetime
-        self.dataframes['request'].loc[request_index, 'examiner_1'] = assigned_lecturers.get('examiner_1', '')
-        self.dataframes['request'].loc[request_index, 'examiner_2'] = assigned_lecturers.get('examiner_2', '')
-        self.dataframes['request'].loc[request_index, 'status'] = 'Field and Time Matching'
+        # Buffer the assigned information; it's written to the request dataframe in one go by _write_results
+        self._results.append((
+            request_index,
+            formatted_datetime,
+            assigned_lecturers.get('examiner_1', ''),
+            assigned_lecturers.get('examiner_2', ''),
+        ))
+    
+    def _write_results(self):
+        """Write buffered assignments back to the request dataframe, one bulk assignment per column"""
+        if not self._results:
+            return
+        
+        indices, date_times, examiners_1, examiners_2 = map(list, zip(*self._results))
+        self.dataframes['request'].loc[indices, 'date_time'] = date_times
+        self.dataframes['request'].loc[indices, 'examiner_1'] = examiners_1
+        self.dataframes['request'].loc[indices, 'examiner_2'] = examiners_2
+        self.dataframes['request'].loc[indices, 'status'] = 'Field and Time Matching'
+        self._results = []
     
     def _find_available_timeslot(self, assigned_lecturers, request_row):
         """Find available timeslot for assigned lecturers"""
@@ -168,134 +241,73 @@ class ThesisScheduler:
         if not lecturer_codes:
             return None
         
-        # Get timeslot columns from lecturer availability
-        time_columns = [col for col in self.dataframes['lecturer_availability'].columns if col != 'kode_dosen']
-        
-        for time_col in sorted(time_columns):
-            # Check if any lecturer is already assigned to this timeslot
-            lecturer_conflict = False
-            for lecturer_code in lecturer_codes:
-                if lecturer_code in self.lecturer_timeslot_assignments[time_col]:
-                    lecturer_conflict = True
-                    break
-            
-            if lecturer_conflict:
-                continue
-            
-            # Check if all lecturers are available at this time
-            all_available = True
-            for lecturer_code in lecturer_codes:
-                lecturer_row = self.dataframes['lecturer_availability'][
-                    self.dataframes['lecturer_availability']['kode_dosen'] == lecturer_code
-                ]
-                
-                if lecturer_row.empty:
-                    all_available = False
-                    break
-                
-                availability = lecturer_row[time_col].iloc[0]
-                if not (availability == True or availability == 'TRUE' or availability == 'true'):
-                    all_available = False
-                    break
-            
-            if all_available:
-                # Check if enough consecutive slots are available
-                if self._check_consecutive_slots(time_col, lecturer_codes, request_row):
-                    return time_col
+        # Every lecturer must appear in the availability data
+        lec_ix = [self._lec_idx.get(lecturer_code) for lecturer_code in lecturer_codes]
+        if None in lec_ix:
+            return None
         
-        return None
-    
-    def _check_consecutive_slots(self, start_time_col, lecturer_codes, request_row):
-        """Check if enough consecutive timeslots are available"""
         capstone_code = request_row.get('capstone_code', '')
         if pd.notna(capstone_code) and capstone_code != '' and str(capstone_code).strip() != '':
-            group_size = len(self.capstone_groups.get(capstone_code, {}).get('members', []))
-            required_slots = self.capstone_duration.get(str(group_size), self.default_timeslot)
+            required_slots = self.capstone_groups.get(capstone_code, {}).get('required_slots', self.default_timeslot)
         else:
             required_slots = self.default_timeslot
         
-        # Parse the start time
-        try:
-            date_part, time_part = start_time_col.split('_')
-            start_hour = int(time_part[:2])
-            start_minute = int(time_part[2:])
-        except:
-            return False
+        # Start timeslots where all lecturers are available and unassigned for the whole duration
+        window_ok = self._refresh_feasibility(lec_ix, required_slots)
         
-        # Check consecutive slots
-        for slot_offset in range(required_slots):
-            current_minute = start_minute + (slot_offset * 30)
-            current_hour = start_hour + (current_minute // 60)
-            current_minute = current_minute % 60
-            
-            current_time_col = f"{date_part}_{current_hour:02d}{current_minute:02d}"
-            
-            # Check for parallel event capacity
-            try:
-                c_date_part, c_time_part = current_time_col.split('_')
-                formatted_date = f"{c_date_part[:4]}-{c_date_part[4:6]}-{c_date_part[6:8]}"
-                formatted_time = f"{c_time_part[:2]}:{c_time_part[2:]}"
-            except:
-                return False
-
-            mask = (self.dataframes['timeslots']['date'] == formatted_date) & \
-                   (self.dataframes['timeslots']['time'] == formatted_time)
-            
-            matching_rows = self.dataframes['timeslots'][mask]
-            if matching_rows.empty:
-                return False
-
-            row_idx = matching_rows.index[0]
-            slot_columns = [col for col in self.dataframes['timeslots'].columns if col.startswith('slot_')]
-            
-            occupied_slots = 0
-            for slot_col in slot_columns:
-                if self.dataframes['timeslots'].loc[row_idx, slot_col] != 'none':
-                    occupied_slots += 1
-            
-            if occupied_slots >= self.parallel_event:
-                return False
-
-            # Check if this timeslot exists
-            if current_time_col not in self.dataframes['lecturer_availability'].columns:
-                return False
-            
-            # Check if any lecturer is already assigned to this consecutive timeslot
-            for lecturer_code in lecturer_codes:
-                if lecturer_code in self.lecturer_timeslot_assignments[current_time_col]:
-                    return False
-            
-            # Check if all lecturers are available at this consecutive timeslot
-            for lecturer_code in lecturer_codes:
-                lecturer_row = self.dataframes['lecturer_availability'][
-                    self.dataframes['lecturer_availability']['kode_dosen'] == lecturer_code
-                ]
-                
-                if lecturer_row.empty:
-                    return False
-                
-                availability = lecturer_row[current_time_col].iloc[0]
-                if not (availability == True or availability == 'TRUE' or availability == 'true'):
-                    return False
+        start_indices = np.flatnonzero(window_ok)
+        if start_indices.size:
+            return self._time_cols[start_indices[0]]
         
-        return True
+        return None
+    
+    def _refresh_feasibility(self, lec_ix, required_slots):
+        """Mark start timeslots where all given lecturers are free for `required_slots` consecutive slots"""
+        num_slots = len(self._time_cols)
+        window_ok = np.zeros(num_slots, dtype=bool)
+        if required_slots < 1 or required_slots > num_slots:
+            return window_ok
+        
+        combined = (self._avail[lec_ix].all(axis=0) & ~self._conflict[lec_ix].any(axis=0) &
+                    (self._parallel_count < self.parallel_event))
+        
+        # A window of k slots starting at i is feasible when all k slots are free
+        # and each of its k - 1 steps moves 30 minutes forward on the same date
+        k = required_slots
+        csum = np.concatenate(([0], np.cumsum(combined)))
+        window_ok[:num_slots - k + 1] = ((csum[k:] - csum[:-k]) == k) & self._consecutive_window(k)
+        return window_ok
+    
+    def _consecutive_window(self, k):
+        """Mark start columns whose `k` slots are consecutive 30-minute steps on one date (cached per k)"""
+        window = self._consecutive_windows.get(k)
+        if window is None:
+            num_slots = len(self._time_cols)
+            steps = np.concatenate(([0], np.cumsum(self._next_is_consecutive)))
+            window = (steps[k - 1:] - steps[:num_slots - k + 1]) == k - 1
+            self._consecutive_windows[k] = window
+        return window
+    
+    def _slot_sequence(self, start_timeslot, num_slots):
+        """List (date_part, hour, minute) for `num_slots` consecutive 30-minute slots from a start column"""
+        start_idx = self._time_idx.get(start_timeslot)
+        if start_idx is None:
+            return None
+        
+        date_part = self._slot_date[start_idx]
+        start_minutes = int(self._slot_minute[start_idx])
+        return [(date_part, *divmod(start_minutes + slot_offset * 30, 60)) for slot_offset in range(num_slots)]
     
     def _assign_to_timeslot(self, request_row, timeslot, capstone_code):
         """Assign request to timeslot dataframe for all consecutive slots"""
         # Convert timeslot format to match timeslots dataframe
-        try:
-            date_part, time_part = timeslot.split('_')
-            formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}"
-            start_hour = int(time_part[:2])
-            start_minute = int(time_part[2:])
-        except:
+        if timeslot not in self._time_idx:
             return False
         
         # Determine the number of slots needed
         if pd.notna(capstone_code) and capstone_code != '' and str(capstone_code).strip() != '':
-            # For capstone, determine duration based on number of members
-            group_size = len(self.capstone_groups.get(capstone_code, {}).get('members', []))
-            required_slots = self.capstone_duration.get(str(group_size), self.default_timeslot)
+            # For capstone, use the duration computed from the number of members
+            required_slots = self.capstone_groups.get(capstone_code, {}).get('required_slots', self.default_timeslot)
             slot_value = str(capstone_code).strip()
         else:
             # For individual requests, use default timeslot
@@ -303,31 +315,24 @@ class ThesisScheduler:
             slot_value = str(request_row.get('nim', 'Unknown'))
         
         # Fill all consecutive timeslots
-        for slot_offset in range(required_slots):
-            # Calculate current time
-            current_minute = start_minute + (slot_offset * 30)
-            current_hour = start_hour + (current_minute // 60)
-            current_minute = current_minute % 60
-            
+        for date_part, current_hour, current_minute in self._slot_sequence(timeslot, required_slots):
+            formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}"
             formatted_time = f"{current_hour:02d}:{current_minute:02d}"
             
             # Find matching row in timeslots dataframe
-            mask = (self.dataframes['timeslots']['date'] == formatted_date) & \
-                   (self.dataframes['timeslots']['time'] == formatted_time)
+            row_idx = self._ts_row_of.get((formatted_date, formatted_time))
             
-            matching_rows = self.dataframes['timeslots'][mask]
-            
-            if matching_rows.empty:
+            if row_idx is None:
                 continue
             
             # Find available slot
-            row_idx = matching_rows.index[0]
-            slot_columns = [col for col in self.dataframes['timeslots'].columns if col.startswith('slot_')]
-            
-            for slot_col in slot_columns:
-                if self.dataframes['timeslots'].loc[row_idx, slot_col] == 'none':
-                    self.dataframes['timeslots'].loc[row_idx, slot_col] = slot_value
-                    break
+            slot_values = self.dataframes['timeslots'].loc[row_idx, self._slot_cols].to_numpy()
+            free_slots = np.flatnonzero(slot_values == 'none')
+            if free_slots.size:
+                self.dataframes['timeslots'].at[row_idx, self._slot_cols[free_slots[0]]] = slot_value
+                time_idx = self._time_idx.get(f"{date_part}_{current_hour:02d}{current_minute:02d}")
+                if time_idx is not None:
+                    self._parallel_count[time_idx] += 1
         
         # Mark capstone group as assigned if applicable
         if pd.notna(capstone_code) and capstone_code != '' and str(capstone_code).strip() != '':
@@ -339,29 +344,27 @@ class ThesisScheduler:
         """Track timeslot usage for all consecutive slots"""
         required_slots = self.default_timeslot
         
-        # Parse the start time
-        try:
-            date_part, time_part = start_timeslot.split('_')
-            start_hour = int(time_part[:2])
-            start_minute = int(time_part[2:])
-        except:
+        slots = self._slot_sequence(start_timeslot, required_slots)
+        if slots is None:
             return
         
         # Track all consecutive slots
-        for slot_offset in range(required_slots):
-            current_minute = start_minute + (slot_offset * 30)
-            current_hour = start_hour + (current_minute // 60)
-            current_minute = current_minute % 60
-            
+        for date_part, current_hour, current_minute in slots:
             current_time_col = f"{date_part}_{current_hour:02d}{current_minute:02d}"
             
+            time_idx = self._time_idx.get(current_time_col)
+            if time_idx is None:
+                continue
+            
             # Track this timeslot as scheduled
-            self.scheduled_timeslots.add(current_time_col)
+            self._scheduled[time_idx] = True
             
             # Track lecturer assignments for this timeslot
             for lecturer in assigned_lecturers.values():
                 if lecturer and lecturer != '':
-                    self.lecturer_timeslot_assignments[current_time_col].add(lecturer)
+                    lec_idx = self._lec_idx.get(lecturer)
+                    if lec_idx is not None:
+                        self._conflict[lec_idx, time_idx] = True
         
         # Update overall lecturer assignment count (only once per session)
         for lecturer in assigned_lecturers.values():
@@ -399,8 +402,7 @@ class ThesisScheduler:
         
         capstone_code = request_row.get('capstone_code', '')
         if pd.notna(capstone_code) and capstone_code != '' and str(capstone_code).strip() != '':
-            group_size = len(self.capstone_groups.get(capstone_code, {}).get('members', []))
-            required_slots = self.capstone_duration.get(str(group_size), self.default_timeslot)
+            required_slots = self.capstone_groups.get(capstone_code, {}).get('required_slots', self.default_timeslot)
         else:
             required_slots = self.default_timeslot
 
@@ -420,31 +422,25 @@ class ThesisScheduler:
             except:
                 return False
 
-            mask = (self.dataframes['timeslots']['date'] == formatted_date) & \
-                   (self.dataframes['timeslots']['time'] == formatted_time)
-            
-            matching_rows = self.dataframes['timeslots'][mask]
-            if matching_rows.empty:
+            row_idx = self._ts_row_of.get((formatted_date, formatted_time))
+            if row_idx is None:
                 return False
 
-            row_idx = matching_rows.index[0]
-            slot_columns = [col for col in self.dataframes['timeslots'].columns if col.startswith('slot_')]
-            
-            occupied_slots = 0
-            for slot_col in slot_columns:
-                if self.dataframes['timeslots'].loc[row_idx, slot_col] != 'none':
-                    occupied_slots += 1
+            slot_values = self.dataframes['timeslots'].loc[row_idx, self._slot_cols].to_numpy()
+            occupied_slots = np.count_nonzero(slot_values != 'none')
             
             if occupied_slots >= self.parallel_event:
                 return False
 
             # Check timeslot exists
-            if current_time_col not in self.dataframes['lecturer_availability'].columns:
+            time_idx = self._time_idx.get(current_time_col)
+            if time_idx is None:
                 return False
             
             # Check any lecturer conflicts
             for lecturer_code in lecturer_codes:
-                if lecturer_code in self.lecturer_timeslot_assignments[current_time_col]:
+                lec_idx = self._lec_idx.get(lecturer_code)
+                if lec_idx is not None and self._conflict[lec_idx, time_idx]:
                     return False
         
         return True
@@ -454,18 +450,10 @@ class ThesisScheduler:
         field_1 = request_row.get('field_1', '')
         field_2 = request_row.get('field_2', '')
         
-        eligible_lecturers = []
+        # Lecturers whose expertise matches field_1 or field_2
+        eligible_lecturers = self._by_expertise.get(field_1, set()) | self._by_expertise.get(field_2, set())
         
-        for _, lecturer in self.dataframes['lecturers'].iterrows():
-            lecturer_code = lecturer['kode_dosen']
-            expertise_list = lecturer['expertise']
-            
-            # Check if lecturer expertise matches field_1 or field_2
-            if isinstance(expertise_list, list):
-                if field_1 in expertise_list or field_2 in expertise_list:
-                    eligible_lecturers.append(lecturer_code)
-        
-        return eligible_lecturers
+        return sorted(eligible_lecturers, key=self._lecturer_order.__getitem__)
     
     def _assign_lecturers(self, request_row, examiner_pool):
         """Assign lecturers to request"""
@@ -476,231 +464,36 @@ class ThesisScheduler:
             'examiner_2': request_row.get('examiner_2', '')
         }
         
+        # Pool as a heap of (assignment count, pool position, code) so the least assigned lecturer
+        # (first in pool order on ties) is popped first. Skipped lecturers are already assigned to
+        # this request, so they stay ineligible for the later picks too
+        pool_heap = [(self.lecturer_assignments.get(lec, 0), position, lec)
+                     for position, lec in enumerate(examiner_pool)]
+        heapq.heapify(pool_heap)
+        
+        def pop_least_assigned(excluded):
+            while pool_heap:
+                _, _, lec = heapq.heappop(pool_heap)
+                if lec not in excluded:
+                    return lec
+            return None
+        
         # spv_1 cannot be empty - if empty, assign from pool
         if not assigned['spv_1'] or pd.isna(assigned['spv_1']):
-            if examiner_pool:
-                assigned['spv_1'] = min(examiner_pool, key=lambda x: self.lecturer_assignments[x])
-                examiner_pool.remove(assigned['spv_1'])
+            lecturer = pop_least_assigned(())
+            if lecturer is not None:
+                assigned['spv_1'] = lecturer
         
         # Assign examiner_1 if empty
         if not assigned['examiner_1'] or pd.isna(assigned['examiner_1']):
-            available_pool = [lec for lec in examiner_pool if lec != assigned['spv_1'] and lec != assigned['spv_2']]
-            if available_pool:
-                assigned['examiner_1'] = min(available_pool, key=lambda x: self.lecturer_assignments[x])
-                examiner_pool.remove(assigned['examiner_1'])
+            lecturer = pop_least_assigned((assigned['spv_1'], assigned['spv_2']))
+            if lecturer is not None:
+                assigned['examiner_1'] = lecturer
         
         # Assign examiner_2 if empty
         if not assigned['examiner_2'] or pd.isna(assigned['examiner_2']):
-            available_pool = [lec for lec in examiner_pool if lec not in assigned.values()]
-            if available_pool:
-                assigned['examiner_2'] = min(available_pool, key=lambda x: self.lecturer_assignments[x])
+            lecturer = pop_least_assigned(list(assigned.values()))
+            if lecturer is not None:
+                assigned['examiner_2'] = lecturer
         
         return assigned
-    
-    def _find_available_timeslot(self, assigned_lecturers, request_row):
-        """Find available timeslot for assigned lecturers"""
-        # Get all assigned lecturer codes (excluding empty ones)
-        lecturer_codes = [lec for lec in assigned_lecturers.values() if lec and not pd.isna(lec)]
-        
-        if not lecturer_codes:
-            return None
-        
-        # Get timeslot columns from lecturer availability
-        time_columns = [col for col in self.dataframes['lecturer_availability'].columns if col != 'kode_dosen']
-        
-        for time_col in sorted(time_columns):
-            # Check if any lecturer is already assigned to this timeslot
-            lecturer_conflict = False
-            for lecturer_code in lecturer_codes:
-                if lecturer_code in self.lecturer_timeslot_assignments[time_col]:
-                    lecturer_conflict = True
-                    break
-            
-            if lecturer_conflict:
-                continue
-            
-            # Check if all lecturers are available at this time
-            all_available = True
-            for lecturer_code in lecturer_codes:
-                lecturer_row = self.dataframes['lecturer_availability'][
-                    self.dataframes['lecturer_availability']['kode_dosen'] == lecturer_code
-                ]
-                
-                if lecturer_row.empty:
-                    all_available = False
-                    break
-                
-                availability = lecturer_row[time_col].iloc[0]
-                if not (availability == True or availability == 'TRUE' or availability == 'true'):
-                    all_available = False
-                    break
-            
-            if all_available:
-                # Check if enough consecutive slots are available
-                if self._check_consecutive_slots(time_col, lecturer_codes, request_row):
-                    return time_col
-        
-        return None
-    
-    def _check_consecutive_slots(self, start_time_col, lecturer_codes, request_row):
-        """Check if enough consecutive timeslots are available"""
-        capstone_code = request_row.get('capstone_code', '')
-        if pd.notna(capstone_code) and capstone_code != '' and str(capstone_code).strip() != '':
-            group_size = len(self.capstone_groups.get(capstone_code, {}).get('members', []))
-            required_slots = self.capstone_duration.get(str(group_size), self.default_timeslot)
-        else:
-            required_slots = self.default_timeslot
-        
-        # Parse the start time
-        try:
-            date_part, time_part = start_time_col.split('_')
-            start_hour = int(time_part[:2])
-            start_minute = int(time_part[2:])
-        except:
-            return False
-        
-        # Check consecutive slots
-        for slot_offset in range(required_slots):
-            current_minute = start_minute + (slot_offset * 30)
-            current_hour = start_hour + (current_minute // 60)
-            current_minute = current_minute % 60
-            
-            current_time_col = f"{date_part}_{current_hour:02d}{current_minute:02d}"
-            
-            # Check for parallel event capacity
-            try:
-                c_date_part, c_time_part = current_time_col.split('_')
-                formatted_date = f"{c_date_part[:4]}-{c_date_part[4:6]}-{c_date_part[6:8]}"
-                formatted_time = f"{c_time_part[:2]}:{c_time_part[2:]}"
-            except:
-                return False
-
-            mask = (self.dataframes['timeslots']['date'] == formatted_date) & \
-                   (self.dataframes['timeslots']['time'] == formatted_time)
-            
-            matching_rows = self.dataframes['timeslots'][mask]
-            if matching_rows.empty:
-                return False
-
-            row_idx = matching_rows.index[0]
-            slot_columns = [col for col in self.dataframes['timeslots'].columns if col.startswith('slot_')]
-            
-            occupied_slots = 0
-            for slot_col in slot_columns:
-                if self.dataframes['timeslots'].loc[row_idx, slot_col] != 'none':
-                    occupied_slots += 1
-            
-            if occupied_slots >= self.parallel_event:
-                return False
-
-            # Check if this timeslot exists
-            if current_time_col not in self.dataframes['lecturer_availability'].columns:
-                return False
-            
-            # Check if any lecturer is already assigned to this consecutive timeslot
-            for lecturer_code in lecturer_codes:
-                if lecturer_code in self.lecturer_timeslot_assignments[current_time_col]:
-                    return False
-            
-            # Check if all lecturers are available at this consecutive timeslot
-            for lecturer_code in lecturer_codes:
-                lecturer_row = self.dataframes['lecturer_availability'][
-                    self.dataframes['lecturer_availability']['kode_dosen'] == lecturer_code
-                ]
-                
-                if lecturer_row.empty:
-                    return False
-                
-                availability = lecturer_row[current_time_col].iloc[0]
-                if not (availability == True or availability == 'TRUE' or availability == 'true'):
-                    return False
-        
-        return True
-    
-    def _assign_to_timeslot(self, request_row, timeslot, capstone_code):
-        """Assign request to timeslot dataframe for all consecutive slots"""
-        # Convert timeslot format to match timeslots dataframe
-        try:
-            date_part, time_part = timeslot.split('_')
-            formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}"
-            start_hour = int(time_part[:2])
-            start_minute = int(time_part[2:])
-        except:
-            return False
-        
-        # Determine the number of slots needed
-        if pd.notna(capstone_code) and capstone_code != '' and str(capstone_code).strip() != '':
-            # For capstone, determine duration based on number of members
-            group_size = len(self.capstone_groups.get(capstone_code, {}).get('members', []))
-            required_slots = self.capstone_duration.get(str(group_size), self.default_timeslot)
-            slot_value = str(capstone_code).strip()
-        else:
-            # For individual requests, use default timeslot
-            required_slots = self.default_timeslot
-            slot_value = str(request_row.get('nim', 'Unknown'))
-        
-        # Fill all consecutive timeslots
-        for slot_offset in range(required_slots):
-            # Calculate current time
-            current_minute = start_minute + (slot_offset * 30)
-            current_hour = start_hour + (current_minute // 60)
-            current_minute = current_minute % 60
-            
-            formatted_time = f"{current_hour:02d}:{current_minute:02d}"
-            
-            # Find matching row in timeslots dataframe
-            mask = (self.dataframes['timeslots']['date'] == formatted_date) & \
-                   (self.dataframes['timeslots']['time'] == formatted_time)
-            
-            matching_rows = self.dataframes['timeslots'][mask]
-            
-            if matching_rows.empty:
-                continue
-            
-            # Find available slot
-            row_idx = matching_rows.index[0]
-            slot_columns = [col for col in self.dataframes['timeslots'].columns if col.startswith('slot_')]
-            
-            for slot_col in slot_columns:
-                if self.dataframes['timeslots'].loc[row_idx, slot_col] == 'none':
-                    self.dataframes['timeslots'].loc[row_idx, slot_col] = slot_value
-                    break
-        
-        # Mark capstone group as assigned if applicable
-        if pd.notna(capstone_code) and capstone_code != '' and str(capstone_code).strip() != '':
-            self.capstone_groups[capstone_code]['assigned_slot'] = timeslot
-        
-        return True
-    
-    def _track_timeslot_usage(self, start_timeslot, assigned_lecturers):
-        """Track timeslot usage for all consecutive slots"""
-        required_slots = self.default_timeslot
-        
-        # Parse the start time
-        try:
-            date_part, time_part = start_timeslot.split('_')
-            start_hour = int(time_part[:2])
-            start_minute = int(time_part[2:])
-        except:
-            return
-        
-        # Track all consecutive slots
-        for slot_offset in range(required_slots):
-            current_minute = start_minute + (slot_offset * 30)
-            current_hour = start_hour + (current_minute // 60)
-            current_minute = current_minute % 60
-            
-            current_time_col = f"{date_part}_{current_hour:02d}{current_minute:02d}"
-            
-            # Track this timeslot as scheduled
-            self.scheduled_timeslots.add(current_time_col)
-            
-            # Track lecturer assignments for this timeslot
-            for lecturer in assigned_lecturers.values():
-                if lecturer and lecturer != '':
-                    self.lecturer_timeslot_assignments[current_time_col].add(lecturer)
-        
-        # Update overall lecturer assignment count (only once per session)
-        for lecturer in assigned_lecturers.values():
-            if lecturer and lecturer != '':
-                self.lecturer_assignments[lecturer] += 1
@@ -10,6 +10,10 @@ import pandas as pd
 import re
 from typing import List, Dict, Optional
 
+# Date header patterns, compiled once for every header cell
+DATE_PUNCTUATION_PATTERN = re.compile(r'[^\w\s,]')
+DATE_PATTERN = re.compile(r'(\w+),?\s*(\d+)\s+(\w+)\s+(\d{4})')
+
 
 class AvailabilityCSVCleaner:
     """Cleans and preprocesses availability CSV files from Excel exports."""
@@ -132,10 +136,10 @@ class AvailabilityCSVCleaner:
         """
         try:
             # Clean the date string
-            date_clean = re.sub(r'[^\w\s,]', '', date_str)
+            date_clean = DATE_PUNCTUATION_PATTERN.sub('', date_str)
             
             # Parse components
-            match = re.search(r'(\w+),?\s*(\d+)\s+(\w+)\s+(\d{4})', date_clean)
+            match = DATE_PATTERN.search(date_clean)
             if match:
                 day, date, month, year = match.groups()
                 return f"{day}_{date}_{month}_{year}"
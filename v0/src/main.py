@@ -6,20 +6,33 @@ This module provides the high-level API for running the scheduling system
 with different input/output configurations.
 """
 
+import re
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
 from .config import Config
-from .models import DataLoader, ScheduleResult
-from .scheduler import SchedulingEngine
-from .utils import ReportGenerator, ValidationHelper
-from .csv_cleaner import AvailabilityCSVCleaner
+
+# The scheduling modules pull in pandas, so they are imported where they are
+# first needed; --help and --setup then start without loading it
+if TYPE_CHECKING:
+    from .csv_cleaner import AvailabilityCSVCleaner
+    from .models import ScheduleResult
+    from .scheduler import SchedulingEngine
+    from .utils import ReportGenerator
+
+# Markers of a raw availability export: the June/July 2025 date headers of merged
+# cells, pandas' 'Unnamed:' columns and the bare 1-4 columns left under them
+RAW_DATE_PATTERN = re.compile(r'(?:June|July) 2025')
+RAW_HEADER_PATTERN = re.compile(r'(?:June|July) 2025|\AUnnamed:|\A[1-4]\Z')
 
 
 class ThesisSchedulerApp:
     """Main application class for the thesis scheduler."""
     
+    # Shared by all app instances; the cleaner keeps no per-file state
+    _cleaner: Optional['AvailabilityCSVCleaner'] = None
+    
     def __init__(self, base_dir: Optional[str] = None):
         """
         Initialize the scheduler application.
@@ -28,13 +41,52 @@ class ThesisSchedulerApp:
             base_dir: Base directory for the project. If None, uses current working directory.
         """
         self.config = Config(base_dir)
-        self.engine = SchedulingEngine(self.config)
-        self.report_generator = ReportGenerator(self.config)
+        
+        # Required input columns, resolved from the column mappings once
+        column_mappings = self.config.column_mappings
+        availability_mappings = column_mappings['availability']
+        request_mappings = column_mappings['request']
+        self._required_avail_cols = [
+            availability_mappings['name'],
+            availability_mappings['expertise']
+        ]
+        # Use the first option from the config lists for validation
+        self._required_request_cols = [
+            request_mappings[key][0]
+            for key in ('student_name', 'student_id', 'field1', 'field2', 'supervisor1')
+        ]
+        
+        self._engine: Optional['SchedulingEngine'] = None
+        self._report_generator: Optional['ReportGenerator'] = None
         
         # Ensure directories exist
         if not self.config.validate_paths():
             raise RuntimeError("Failed to create required directories")
     
+    @property
+    def engine(self) -> 'SchedulingEngine':
+        """Scheduling engine, created on first use."""
+        if self._engine is None:
+            from .scheduler import SchedulingEngine
+            self._engine = SchedulingEngine(self.config)
+        return self._engine
+    
+    @property
+    def report_generator(self) -> 'ReportGenerator':
+        """Report generator, created on first use."""
+        if self._report_generator is None:
+            from .utils import ReportGenerator
+            self._report_generator = ReportGenerator(self.config)
+        return self._report_generator
+    
+    @classmethod
+    def _get_cleaner(cls) -> 'AvailabilityCSVCleaner':
+        """Get the shared availability CSV cleaner, created on first use."""
+        if cls._cleaner is None:
+            from .csv_cleaner import AvailabilityCSVCleaner
+            cls._cleaner = AvailabilityCSVCleaner()
+        return cls._cleaner
+    
     def schedule_from_files(self, availability_file: str, request_file: str, 
                           output_file: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -48,6 +100,8 @@ class ThesisSchedulerApp:
         Returns:
             Dictionary with scheduling results and summary
         """
+        from .models import DataLoader
+        
         print("="*60)
         print("THESIS DEFENSE SCHEDULER")
         print("="*60)
@@ -145,40 +199,29 @@ class ThesisSchedulerApp:
     
     def _validate_input_data(self, availability_df, request_df):
         """Validate input data structure."""
+        from .utils import ValidationHelper
+        
         # Validate availability data
-        required_avail_cols = [
-            self.config.column_mappings['availability']['name'],
-            self.config.column_mappings['availability']['expertise']
-        ]
+        required_avail_cols = self._required_avail_cols
         if not ValidationHelper.validate_csv_structure(availability_df, required_avail_cols):
             raise ValueError("Invalid availability data structure")
         
         # Validate request data
-        # Use the first option from the config lists for validation
-        required_request_cols = [
-            self.config.column_mappings['request']['student_name'][0],
-            self.config.column_mappings['request']['student_id'][0],
-            self.config.column_mappings['request']['field1'][0],
-            self.config.column_mappings['request']['field2'][0],
-            self.config.column_mappings['request']['supervisor1'][0]
-        ]
+        required_request_cols = self._required_request_cols
         if not ValidationHelper.validate_csv_structure(request_df, required_request_cols):
             raise ValueError("Invalid request data structure")
         
-        # Validate individual student records
-        student_required_fields = [
-            self.config.column_mappings['request']['student_name'][0],
-            self.config.column_mappings['request']['student_id'][0],
-            self.config.column_mappings['request']['field1'][0],
-            self.config.column_mappings['request']['field2'][0],
-            self.config.column_mappings['request']['supervisor1'][0]
-        ]
-        for _, row in request_df.iterrows():
-            if not ValidationHelper.validate_student_data(row.to_dict(), student_required_fields):
-                student_name = row.get(student_required_fields[0], 'Unknown')
-                raise ValueError(f"Invalid student data for {student_name}")
+        # Validate individual student records (same required columns, checked per value)
+        student_required_fields = required_request_cols
+        valid_mask = ValidationHelper.validate_student_dataframe(request_df, student_required_fields)
+        if not valid_mask.all():
+            # Report the first invalid record with the per-row validator's message
+            row = request_df[~valid_mask].iloc[0]
+            ValidationHelper.validate_student_data(row.to_dict(), student_required_fields)
+            student_name = row.get(student_required_fields[0], 'Unknown')
+            raise ValueError(f"Invalid student data for {student_name}")
     
-    def _result_to_dict(self, result: ScheduleResult) -> Dict[str, Any]:
+    def _result_to_dict(self, result: 'ScheduleResult') -> Dict[str, Any]:
         """Convert ScheduleResult to dictionary for reporting."""
         return {
             'student_name': result.student.name,
@@ -243,37 +286,28 @@ class ThesisSchedulerApp:
         Returns:
             Path to the cleaned file (either the original if already clean, or new cleaned file)
         """
-        import pandas as pd
+        import csv
+        from itertools import islice
         from pathlib import Path
         
         # Check if the file needs cleaning by reading the first few rows
         try:
-            # Read first 3 rows to check the format
-            sample_df = pd.read_csv(availability_file, nrows=3)
+            # Read only the header and the first data row to check the format
+            # (blank lines are skipped, as pandas does)
+            with open(availability_file, newline='', encoding='utf-8-sig') as f:
+                sample_rows = list(islice((row for row in csv.reader(f) if row), 2))
+            if not sample_rows:
+                raise ValueError("No columns to parse from file")
+            header = sample_rows[0]
             
             # Check if this looks like a raw file (has merged cell indicators)
             # Raw files have dates like "Tuesday, 10 June 2025" in the header
-            needs_cleaning = False
-            
-            # Check column headers for date patterns
-            for col in sample_df.columns:
-                if col and (
-                    'June 2025' in str(col) or 
-                    'July 2025' in str(col) or
-                    col.startswith('Unnamed:') or
-                    col in ['1', '2', '3', '4']  # Common unnamed columns from merged cells
-                ):
-                    needs_cleaning = True
-                    break
+            # Check column headers for date patterns (empty headers are pandas' 'Unnamed:' columns)
+            needs_cleaning = any(not col or RAW_HEADER_PATTERN.search(col) for col in header)
             
             # Also check if first row contains date information
-            if not needs_cleaning:
-                first_row = sample_df.iloc[0] if len(sample_df) > 0 else None
-                if first_row is not None:
-                    for value in first_row:
-                        if value and ('June 2025' in str(value) or 'July 2025' in str(value)):
-                            needs_cleaning = True
-                            break
+            if not needs_cleaning and len(sample_rows) > 1:
+                needs_cleaning = any(RAW_DATE_PATTERN.search(value) for value in sample_rows[1])
             
             if not needs_cleaning:
                 print("✓ Availability file is already in clean format")
@@ -288,8 +322,7 @@ class ThesisSchedulerApp:
             output_path = input_path.parent / f"{input_path.stem}_cleaned{input_path.suffix}"
             
             # Clean the file
-            cleaner = AvailabilityCSVCleaner()
-            cleaner.clean_availability_csv(availability_file, str(output_path))
+            self._get_cleaner().clean_availability_csv(availability_file, str(output_path))
             
             print(f"✅ Cleaned availability file saved to: {output_path}")
             return str(output_path)
@@ -6,8 +6,10 @@ This module contains classes that represent the core data structures
 used throughout the scheduling system.
 """
 
+import io
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, FrozenSet, Set, Mapping
 import pandas as pd
 
 
@@ -19,6 +21,11 @@ class Judge:
     code: str
     expertise: List[str]
     availability: Dict[str, bool] = field(default_factory=dict)
+    _expertise_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Uppercased expertise codes for O(1) membership checks
+        self._expertise_set = frozenset(exp.upper() for exp in self.expertise)
     
     def is_available_at(self, time_slot: str) -> bool:
         """Check if judge is available at specific time slot."""
@@ -26,7 +33,7 @@ class Judge:
     
     def has_expertise_in(self, field: str) -> bool:
         """Check if judge has expertise in specific field."""
-        return field.upper() in [exp.upper() for exp in self.expertise]
+        return field.upper() in self._expertise_set
 
 
 @dataclass
@@ -52,9 +59,7 @@ class Student:
     
     def get_group_id(self) -> str:
         """Get the group identifier."""
-        if self.capstone and self.capstone.strip():
-            return self.capstone.strip()
-        return ""
+        return self.capstone.strip() if self.capstone else ""
     
     def get_supervisors(self) -> List[str]:
         """Get list of supervisors (excluding '-' placeholders)."""
@@ -83,17 +88,13 @@ class GroupDefense:
     
     def get_all_supervisors(self) -> List[str]:
         """Get all unique supervisors from all students in the group."""
-        all_supervisors = []
-        for student in self.students:
-            all_supervisors.extend(student.get_supervisors())
-        return list(set(all_supervisors))  # Remove duplicates
+        return list({supervisor for student in self.students
+                     for supervisor in student.get_supervisors()})  # Remove duplicates
     
     def get_combined_fields(self) -> List[str]:
         """Get all unique fields from all students in the group."""
-        all_fields = []
-        for student in self.students:
-            all_fields.extend(student.get_required_fields())
-        return list(set(all_fields))  # Remove duplicates
+        return list({required_field for student in self.students
+                     for required_field in student.get_required_fields()})  # Remove duplicates
     
     def get_student_names(self) -> List[str]:
         """Get list of all student names in the group."""
@@ -120,26 +121,15 @@ class ScheduleResult:
     
     def get_recommendations_string(self) -> str:
         """Get recommendations as formatted string."""
-        if len(self.recommended_judges) >= 2:
-            return f"{self.recommended_judges[0]} | {self.recommended_judges[1]}"
-        elif len(self.recommended_judges) == 1:
-            return f"{self.recommended_judges[0]} | NONE"
-        else:
-            return "NONE | NONE"
+        return f"{self.get_penguji_1()} | {self.get_penguji_2()}"
     
     def get_penguji_1(self) -> str:
         """Get first judge (Penguji 1)."""
-        if len(self.recommended_judges) >= 1:
-            return self.recommended_judges[0]
-        else:
-            return "NONE"
+        return (self.recommended_judges[:1] or ["NONE"])[0]
     
     def get_penguji_2(self) -> str:
         """Get second judge (Penguji 2)."""
-        if len(self.recommended_judges) >= 2:
-            return self.recommended_judges[1]
-        else:
-            return "NONE"
+        return (self.recommended_judges[1:2] or ["NONE"])[0]
 
 
 @dataclass
@@ -156,7 +146,7 @@ class PanelConfiguration:
     
     def get_all_judge_codes(self) -> List[str]:
         """Get all judge codes in the panel."""
-        return [judge.code for judge in self.get_all_judges()]
+        return [judge.code for judges in (self.supervisors, self.examiners) for judge in judges]
     
     def is_valid(self) -> bool:
         """Check if panel configuration is valid."""
@@ -172,15 +162,21 @@ class SchedulingSession:
     results: List[ScheduleResult] = field(default_factory=list)
     judge_workload: Dict[str, int] = field(default_factory=dict)  # Track assignment count per judge
     parallel_defenses_count: Dict[str, int] = field(default_factory=dict)  # Track parallel defenses per time slot
+    # Same judge codes as scheduled_slots as sets, for O(1) membership checks (the lists keep reservation order)
+    _scheduled_codes: Dict[str, Set[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def reserve_time_slot(self, time_slot: str, judge_codes: List[str]):
         """Reserve a time slot for specific judges."""
         if time_slot not in self.scheduled_slots:
             self.scheduled_slots[time_slot] = []
             self.parallel_defenses_count[time_slot] = 0
+        slot_codes = self._scheduled_codes.get(time_slot)
+        if slot_codes is None:
+            slot_codes = self._scheduled_codes[time_slot] = set(self.scheduled_slots[time_slot])
         
         for code in judge_codes:
-            if code not in self.scheduled_slots[time_slot]:
+            if code not in slot_codes:
+                slot_codes.add(code)
                 self.scheduled_slots[time_slot].append(code)
                 # Update workload tracking
                 self.judge_workload[code] = self.judge_workload.get(code, 0) + 1
@@ -190,8 +186,12 @@ class SchedulingSession:
     
     def is_judge_available(self, judge_code: str, time_slot: str) -> bool:
         """Check if judge is available at time slot (not already scheduled)."""
-        return (time_slot not in self.scheduled_slots or 
-                judge_code not in self.scheduled_slots[time_slot])
+        if time_slot not in self.scheduled_slots:
+            return True
+        slot_codes = self._scheduled_codes.get(time_slot)
+        if slot_codes is None:
+            return judge_code not in self.scheduled_slots[time_slot]
+        return judge_code not in slot_codes
     
     def can_schedule_parallel_defense(self, time_slot: str, max_parallel: int) -> bool:
         """Check if we can schedule another parallel defense in this time slot."""
@@ -202,17 +202,20 @@ class SchedulingSession:
         """Get the current workload (assignment count) for a judge."""
         return self.judge_workload.get(judge_code, 0)
     
-    def get_workload_summary(self) -> Dict[str, int]:
+    # The summaries are read-only views of the session state, not copies;
+    # wrap them in dict() where a snapshot is needed
+    
+    def get_workload_summary(self) -> Mapping[str, int]:
         """Get summary of judge workload distribution."""
-        return dict(self.judge_workload)
+        return MappingProxyType(self.judge_workload)
     
-    def get_parallel_defenses_summary(self) -> Dict[str, int]:
+    def get_parallel_defenses_summary(self) -> Mapping[str, int]:
         """Get summary of parallel defenses per time slot."""
-        return dict(self.parallel_defenses_count)
+        return MappingProxyType(self.parallel_defenses_count)
     
-    def get_utilization_summary(self) -> Dict[str, List[str]]:
+    def get_utilization_summary(self) -> Mapping[str, List[str]]:
         """Get summary of time slot utilization."""
-        return dict(self.scheduled_slots)
+        return MappingProxyType(self.scheduled_slots)
 
 
 class DataLoader:
@@ -232,11 +235,11 @@ class DataLoader:
     def load_request_data(file_path: str) -> pd.DataFrame:
         """Load thesis defense requests from CSV."""
         try:
-            # Try to load with comment handling first
-            try:
-                df = pd.read_csv(file_path, comment='//')
-            except:
-                df = pd.read_csv(file_path)
+            # Skip '//' comment lines (pandas only supports single-character comment markers),
+            # reading the file once
+            with open(file_path, encoding='utf-8-sig') as f:
+                lines = [line for line in f if not line.lstrip().startswith('//')]
+            df = pd.read_csv(io.StringIO(''.join(lines)))
             
             # Remove empty rows
             df = df.dropna(subset=['Nama', 'Nim'])
@@ -250,28 +253,26 @@ class DataLoader:
                     output_path: str) -> pd.DataFrame:
         """Save scheduling results to CSV."""
         try:
-            updated_rows = []
+            # Result columns are collected in one pass and assigned to a copy of the original rows
+            times, penguji_1, penguji_2, statuses = [], [], [], []
             
-            for i, result in enumerate(results):
-                # Get original row data
-                original_row = original_df.iloc[i].to_dict()
-                
+            for result in results:
                 # Update with scheduling results
                 if result.scheduled:
-                    original_row['Tanggal dan Waktu (Format: YYYYMMDD-HHMM)'] = result.get_formatted_time()
-                    original_row['Penguji 1'] = result.get_penguji_1()
-                    original_row['Penguji 2'] = result.get_penguji_2()
-                    original_row['Status'] = result.status or "Unknown"
+                    times.append(result.get_formatted_time())
+                    statuses.append(result.status or "Unknown")
                 else:
-                    original_row['Tanggal dan Waktu (Format: YYYYMMDD-HHMM)'] = f"NOT_SCHEDULED: {result.reason}"
-                    original_row['Penguji 1'] = result.get_penguji_1()
-                    original_row['Penguji 2'] = result.get_penguji_2()
-                    original_row['Status'] = "Not Scheduled"
-                
-                updated_rows.append(original_row)
+                    times.append(f"NOT_SCHEDULED: {result.reason}")
+                    statuses.append("Not Scheduled")
+                penguji_1.append(result.get_penguji_1())
+                penguji_2.append(result.get_penguji_2())
             
             # Create DataFrame and save
-            updated_df = pd.DataFrame(updated_rows)
+            updated_df = original_df.iloc[:len(results)].reset_index(drop=True)
+            updated_df['Tanggal dan Waktu (Format: YYYYMMDD-HHMM)'] = times
+            updated_df['Penguji 1'] = penguji_1
+            updated_df['Penguji 2'] = penguji_2
+            updated_df['Status'] = statuses
             updated_df.to_csv(output_path, index=False)
             
             print(f"✅ Results saved to: {output_path}")
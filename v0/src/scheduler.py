@@ -6,7 +6,9 @@ This module contains the main scheduling logic that matches students
 with available judges based on expertise and availability.
 """
 
+import numpy as np
 import pandas as pd
+from collections import defaultdict
 from typing import List, Dict, Optional, Tuple
 from itertools import combinations
 from .models import Judge, Student, ScheduleResult, PanelConfiguration, SchedulingSession, GroupDefense
@@ -24,8 +26,37 @@ class SchedulingEngine:
         self.judge_selector = JudgeSelector(config)
         self.session = SchedulingSession()
         
+        # Scheduling constraints, read from the config file once instead of on every panel search
+        self._constraints = config.scheduling_constraints
+        
         # Connect the session to judge selector for workload balancing
         self.judge_selector.set_session(self.session)
+        
+        # Availability of the loaded judges as a boolean matrix (judge x time slot), with
+        # a matching matrix of reserved slots and the parallel defense count per slot,
+        # so time slot searches are array reductions instead of per-slot dict lookups
+        self._time_cols: List[str] = []
+        self._slot_index: Dict[str, int] = {}
+        self._judge_rows: Dict[int, int] = {}  # id(judge) -> row
+        self._rows_by_code: Dict[str, List[int]] = {}
+        self._avail = np.zeros((0, 0), dtype=bool)
+        self._reserved = np.zeros((0, 0), dtype=bool)
+        self._parallel_count = np.zeros(0, dtype=np.int32)
+        # The same availability and reservations packed into one integer bitmask per judge
+        # (bit c = time slot column c), for first-free-slot searches
+        self._avail_bits: List[int] = []
+        self._reserved_bits: List[int] = []
+        self._full_slot_bits: Dict[int, int] = {}  # max_parallel -> slots at capacity
+        # Loaded judges and their rows per (uppercased) expertise code
+        self._loaded_judges: Optional[List[Judge]] = None
+        self._rows_by_field: Dict[str, List[int]] = {}
+        self._formatted_time: Dict[str, str] = {}
+        
+        # Per-judge match strings for supervisor lookups, cached for the judge list they came from
+        self._supervisor_keys_source: Optional[List[Judge]] = None
+        self._supervisor_keys: List[Tuple] = []
+        self._judge_frame_source: Optional[List[Judge]] = None
+        self._judge_frame: Optional[pd.DataFrame] = None
     
     def load_judges(self, availability_df: pd.DataFrame) -> List[Judge]:
         """
@@ -40,22 +71,27 @@ class SchedulingEngine:
         judges = []
         time_cols = self.data_processor.get_time_slot_columns(availability_df)
         
-        for _, row in availability_df.iterrows():
-            # Parse judge information using config column names
-            name_col = self.config.column_mappings['availability']['name']
-            expertise_col = self.config.column_mappings['availability']['expertise']
-            
-            name = row[name_col]
-            expertise_str = row.get(expertise_col, '')
+        # Parse judge information using config column names, resolved to positions once
+        # so rows can be read as plain tuples
+        name_col = self.config.column_mappings['availability']['name']
+        expertise_col = self.config.column_mappings['availability']['expertise']
+        columns = availability_df.columns
+        name_pos = columns.get_loc(name_col)
+        expertise_pos = columns.get_loc(expertise_col) if expertise_col in columns else None
+        time_positions = [(time_col, columns.get_loc(time_col)) for time_col in time_cols]
+        
+        for row in availability_df.itertuples(index=False, name=None):
+            name = row[name_pos]
+            expertise_str = row[expertise_pos] if expertise_pos is not None else ''
             expertise_codes = self.data_processor.parse_expertise_codes(expertise_str)
             
             # Get judge code from column 2 (index 1) instead of deriving from expertise
-            judge_code = str(row.iloc[1]) if len(row) > 1 and pd.notna(row.iloc[1]) else ""
+            judge_code = str(row[1]) if len(row) > 1 and pd.notna(row[1]) else ""
             
             # Parse availability
             availability = {}
-            for time_col in time_cols:
-                availability[time_col] = bool(row[time_col])
+            for time_col, time_pos in time_positions:
+                availability[time_col] = bool(row[time_pos])
             
             judge = Judge(
                 name=name,
@@ -65,8 +101,134 @@ class SchedulingEngine:
             )
             judges.append(judge)
         
+        self._index_availability(judges, time_cols)
         return judges
     
+    def _index_availability(self, judges: List[Judge], time_cols: List[str]):
+        """
+        Build the availability and reservation matrices for the loaded judges.
+        
+        Args:
+            judges: Judges returned by load_judges
+            time_cols: Time slot column names, in availability file order
+        """
+        self._time_cols = list(time_cols)
+        self._slot_index = {time_col: i for i, time_col in enumerate(self._time_cols)}
+        self._judge_rows = {id(judge): row for row, judge in enumerate(judges)}
+        self._rows_by_code = {}
+        self._rows_by_field = defaultdict(list)
+        for row, judge in enumerate(judges):
+            self._rows_by_code.setdefault(judge.code, []).append(row)
+            for field in judge._expertise_set:
+                self._rows_by_field[field].append(row)
+        self._loaded_judges = judges
+        # Output format (YYYYMMDD-HHMM) of every time slot, computed once
+        self._formatted_time = {time_col: self.time_formatter.format_time_slot(time_col)
+                                for time_col in self._time_cols}
+        
+        self._avail = np.array([[judge.availability[time_col] for time_col in self._time_cols] for judge in judges],
+                               dtype=bool).reshape(len(judges), len(self._time_cols))
+        self._reserved = np.zeros(self._avail.shape, dtype=bool)
+        self._parallel_count = np.zeros(len(self._time_cols), dtype=np.int32)
+        self._avail_bits = [
+            int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little') for row in self._avail
+        ]
+        self._reserved_bits = [0] * len(judges)
+        self._full_slot_bits = {}
+        # Mirror reservations already recorded in the session
+        for time_slot, judge_codes in self.session.scheduled_slots.items():
+            self._mark_reserved(time_slot, judge_codes, self.session.parallel_defenses_count.get(time_slot, 0))
+    
+    def _free_slot_mask(self, judges: List[Judge], max_parallel: int) -> Optional[np.ndarray]:
+        """
+        Mark slots where all given judges are available and unreserved and parallel capacity remains.
+        
+        Args:
+            judges: Judges that must all be free
+            max_parallel: Maximum number of parallel defenses per time slot
+            
+        Returns:
+            Boolean array over time slots, or None if any judge wasn't loaded by load_judges
+        """
+        rows = [self._judge_rows.get(id(judge)) for judge in judges]
+        if None in rows:
+            return None
+        return (self._avail[rows].all(axis=0) & ~self._reserved[rows].any(axis=0) &
+                (self._parallel_count < max_parallel))
+    
+    def _free_slot_bits(self, judges: List[Judge], max_parallel: int) -> Optional[int]:
+        """
+        Bitmask version of _free_slot_mask (bit c set = time slot column c is free for all given judges).
+        
+        Args:
+            judges: Judges that must all be free
+            max_parallel: Maximum number of parallel defenses per time slot
+            
+        Returns:
+            Bitmask over time slots, or None if any judge wasn't loaded by load_judges
+        """
+        if max_parallel not in self._full_slot_bits:
+            self._full_slot_bits[max_parallel] = sum(
+                1 << col for col in np.flatnonzero(self._parallel_count >= max_parallel).tolist()
+            )
+        free_bits = ((1 << len(self._time_cols)) - 1) & ~self._full_slot_bits[max_parallel]
+        for judge in judges:
+            row = self._judge_rows.get(id(judge))
+            if row is None:
+                return None
+            free_bits &= self._avail_bits[row] & ~self._reserved_bits[row]
+        return free_bits
+    
+    def _first_available_slot(self, supervisor_bits: Optional[int], examiner_judges: List[Judge],
+                              supervisor_judges: List[Judge], group_size: int) -> Optional[str]:
+        """
+        Find the first time slot free for the supervisors and an examiner combination.
+        
+        Args:
+            supervisor_bits: Supervisors' free slot bitmask from _free_slot_bits, computed once per panel search
+            examiner_judges: Examiner combination being tried
+            supervisor_judges: List of supervisor judges
+            group_size: Size of the group (affects time slot allocation)
+            
+        Returns:
+            First available time slot name, or None
+        """
+        if supervisor_bits is not None:
+            max_parallel = self._constraints.get('max_parallel_defenses', 3)
+            examiner_bits = self._free_slot_bits(examiner_judges, max_parallel)
+            if examiner_bits is not None:
+                free_bits = supervisor_bits & examiner_bits
+                # Lowest set bit = earliest free time slot
+                return self._time_cols[(free_bits & -free_bits).bit_length() - 1] if free_bits else None
+        
+        available_slots = self.find_available_time_slots(supervisor_judges + examiner_judges, group_size)
+        return available_slots[0] if available_slots else None
+    
+    def _format_time_slot(self, time_slot: str) -> str:
+        """Get the output format of a time slot, precomputed for the loaded time slots."""
+        formatted = self._formatted_time.get(time_slot)
+        if formatted is None:
+            formatted = self.time_formatter.format_time_slot(time_slot)
+        return formatted
+    
+    def _reserve_time_slot(self, time_slot: str, judge_codes: List[str]):
+        """Reserve a time slot in the session and in the reservation matrix."""
+        self.session.reserve_time_slot(time_slot, judge_codes)
+        self._mark_reserved(time_slot, judge_codes, 1)
+    
+    def _mark_reserved(self, time_slot: str, judge_codes: List[str], defenses: int):
+        """Mark judges (by code) as reserved at a time slot and count its parallel defenses."""
+        col = self._slot_index.get(time_slot)
+        if col is None:
+            return
+        for code in judge_codes:
+            rows = self._rows_by_code.get(code, [])
+            self._reserved[rows, col] = True
+            for row in rows:
+                self._reserved_bits[row] |= 1 << col
+        self._parallel_count[col] += defenses
+        self._full_slot_bits = {}
+    
     def load_students(self, request_df: pd.DataFrame) -> List[Student]:
         """
         Convert request DataFrame to Student objects.
@@ -79,24 +241,25 @@ class SchedulingEngine:
         """
         students = []
         
-        # Get column mappings from config
-        student_name_cols = self.config.column_mappings['request']['student_name']
-        student_id_cols = self.config.column_mappings['request']['student_id']
-        field1_cols = self.config.column_mappings['request']['field1']
-        field2_cols = self.config.column_mappings['request']['field2']
-        supervisor1_cols = self.config.column_mappings['request']['supervisor1']
-        supervisor2_cols = self.config.column_mappings['request']['supervisor2']
-        capstone_cols = self.config.column_mappings['request']['capstone']
-        
-        for _, row in request_df.iterrows():
+        # Get column mappings from config, resolved to the positions of the columns present
+        request_mappings = self.config.column_mappings['request']
+        student_name_pos = self._column_positions(request_df, request_mappings['student_name'])
+        student_id_pos = self._column_positions(request_df, request_mappings['student_id'])
+        field1_pos = self._column_positions(request_df, request_mappings['field1'])
+        field2_pos = self._column_positions(request_df, request_mappings['field2'])
+        supervisor1_pos = self._column_positions(request_df, request_mappings['supervisor1'])
+        supervisor2_pos = self._column_positions(request_df, request_mappings['supervisor2'])
+        capstone_pos = self._column_positions(request_df, request_mappings['capstone'])
+        
+        for row in request_df.itertuples(index=False, name=None):
             # Find the first available column for each field
-            name = self._get_first_available_value(row, student_name_cols)
-            student_id = self._get_first_available_value(row, student_id_cols)
-            field1 = self._get_first_available_value(row, field1_cols)
-            field2 = self._get_first_available_value(row, field2_cols)
-            supervisor1 = self._get_first_available_value(row, supervisor1_cols)
-            supervisor2 = self._get_first_available_value(row, supervisor2_cols)
-            capstone = self._get_first_available_value(row, capstone_cols)
+            name = self._get_first_available_value(row, student_name_pos)
+            student_id = self._get_first_available_value(row, student_id_pos)
+            field1 = self._get_first_available_value(row, field1_pos)
+            field2 = self._get_first_available_value(row, field2_pos)
+            supervisor1 = self._get_first_available_value(row, supervisor1_pos)
+            supervisor2 = self._get_first_available_value(row, supervisor2_pos)
+            capstone = self._get_first_available_value(row, capstone_pos)
             
             student = Student(
                 name=name or '',
@@ -125,12 +288,12 @@ class SchedulingEngine:
         individual_students = []
         
         for student in students:
-            if student.is_group_defense():
-                group_id = student.get_group_id()
-                if group_id and group_id not in groups_dict:
+            # The group identifier is empty exactly when the student has no group defense
+            group_id = student.get_group_id()
+            if group_id:
+                if group_id not in groups_dict:
                     groups_dict[group_id] = GroupDefense(group_id=group_id)
-                if group_id:
-                    groups_dict[group_id].students.append(student)
+                groups_dict[group_id].students.append(student)
             else:
                 individual_students.append(student)
         
@@ -150,20 +313,34 @@ class SchedulingEngine:
         
         return grouped_defenses, individual_students
     
-    def _get_first_available_value(self, row: pd.Series, column_names: List[str]) -> Optional[str]:
+    def _column_positions(self, df: pd.DataFrame, column_names: List[str]) -> List[int]:
         """
-        Get the first non-null value from a list of possible column names.
+        Get the positions of the given columns that are present in a DataFrame.
         
         Args:
-            row: Pandas Series representing a row of data
-            column_names: List of column names to check
+            df: DataFrame to look the columns up in
+            column_names: List of column names, in order of preference
+            
+        Returns:
+            Positions of the present columns, in the same order
+        """
+        return [df.columns.get_loc(col_name) for col_name in column_names if col_name in df.columns]
+    
+    def _get_first_available_value(self, row: tuple, column_positions: List[int]) -> Optional[str]:
+        """
+        Get the first non-null value from a list of possible column positions.
+        
+        Args:
+            row: Row of data as a plain tuple (from itertuples)
+            column_positions: Positions of the columns to check, from _column_positions
             
         Returns:
             First non-null value found, or None if all are null
         """
-        for col_name in column_names:
-            if col_name in row and pd.notna(row[col_name]):
-                return str(row[col_name])
+        for col_pos in column_positions:
+            value = row[col_pos]
+            if pd.notna(value):
+                return str(value)
         return None
     
     def find_supervisor_judges(self, student: Student, judges: List[Judge]) -> List[Judge]:
@@ -178,27 +355,31 @@ class SchedulingEngine:
             List of supervisor judges
         """
         supervisor_judges = []
+        supervisor_ids = set()  # id() of the judges already found, for O(1) dedupe
         supervisors = student.get_supervisors()
         
         for supervisor_name in supervisors:
             # Normalize supervisor code
             supervisor_code = self.data_processor.normalize_supervisor_code(
-                supervisor_name, pd.DataFrame([judge.__dict__ for judge in judges])
+                supervisor_name, self._judges_as_frame(judges)
             )
             
+            # Ensure supervisor_name is not null before string operations
+            supervisor_name_str = str(supervisor_name) if pd.notna(supervisor_name) else ""
+            supervisor_name_lower = supervisor_name_str.lower()
+            supervisor_code_upper = supervisor_code.upper()
+            
             # Find matching judge
-            for judge in judges:
+            for judge, expertise, judge_name_str, judge_name_lower, judge_name_upper, judge_code_upper in \
+                    self._supervisor_match_keys(judges):
                 # Check by code, expertise, or name match
-                # Ensure supervisor_name and judge.name are not null before string operations
-                supervisor_name_str = str(supervisor_name) if pd.notna(supervisor_name) else ""
-                judge_name_str = str(judge.name) if pd.notna(judge.name) else ""
-                
-                if (supervisor_code in judge.expertise or 
+                if (supervisor_code in expertise or 
                     (supervisor_name_str and judge_name_str and 
-                     supervisor_name_str.lower() in judge_name_str.lower()) or
-                    supervisor_code.upper() == judge_name_str.upper() or
-                    supervisor_code.upper() == judge.code.upper()):
-                    if judge not in supervisor_judges:
+                     supervisor_name_lower in judge_name_lower) or
+                    supervisor_code_upper == judge_name_upper or
+                    supervisor_code_upper == judge_code_upper):
+                    if id(judge) not in supervisor_ids:
+                        supervisor_ids.add(id(judge))
                         supervisor_judges.append(judge)
                         print(f"✓ Found supervisor: {judge.code} ({judge.name})")
                     break
@@ -207,6 +388,41 @@ class SchedulingEngine:
         
         return supervisor_judges
     
+    def _judges_as_frame(self, judges: List[Judge]) -> pd.DataFrame:
+        """
+        Get the judges as a DataFrame (one row per judge), built once per judge list.
+        
+        Args:
+            judges: List of available judges
+            
+        Returns:
+            DataFrame of the judges' attributes
+        """
+        if judges is not self._judge_frame_source:
+            self._judge_frame = pd.DataFrame([judge.__dict__ for judge in judges])
+            self._judge_frame_source = judges
+        return self._judge_frame
+    
+    def _supervisor_match_keys(self, judges: List[Judge]) -> List[Tuple]:
+        """
+        Get the strings each judge is matched on when resolving supervisors, derived once per judge list.
+        
+        Args:
+            judges: List of available judges
+            
+        Returns:
+            List of (judge, expertise set, name, lowercased name, uppercased name, uppercased code) tuples
+        """
+        if judges is not self._supervisor_keys_source:
+            self._supervisor_keys = []
+            for judge in judges:
+                # Judge names that are null/NaN match as empty strings
+                judge_name_str = str(judge.name) if pd.notna(judge.name) else ""
+                self._supervisor_keys.append((judge, frozenset(judge.expertise), judge_name_str,
+                                              judge_name_str.lower(), judge_name_str.upper(), judge.code.upper()))
+            self._supervisor_keys_source = judges
+        return self._supervisor_keys
+    
     def find_expertise_matches(self, student: Student, judges: List[Judge], 
                              exclude_supervisors: List[Judge]) -> List[Judge]:
         """
@@ -222,7 +438,15 @@ class SchedulingEngine:
         """
         required_fields = student.get_required_fields()
         expertise_matches = []
-        supervisor_codes = [judge.code for judge in exclude_supervisors]
+        match_ids = set()
+        supervisor_codes = {judge.code for judge in exclude_supervisors}
+        
+        # For the loaded judge list, matching judges come from the expertise index (in list order)
+        if judges is self._loaded_judges:
+            rows = set()
+            for field in required_fields:
+                rows.update(self._rows_by_field.get(field.upper(), ()))
+            return [judges[row] for row in sorted(rows) if judges[row].code not in supervisor_codes]
         
         for judge in judges:
             # Skip supervisors
@@ -232,7 +456,8 @@ class SchedulingEngine:
             # Check expertise match
             for field in required_fields:
                 if judge.has_expertise_in(field):
-                    if judge not in expertise_matches:
+                    if id(judge) not in match_ids:
+                        match_ids.add(id(judge))
                         expertise_matches.append(judge)
                     break
         
@@ -253,14 +478,19 @@ class SchedulingEngine:
         if not required_judges:
             return []
         
+        constraints = self._constraints
+        max_parallel = constraints.get('max_parallel_defenses', 3)
+        time_requirement = self.config.get_group_time_requirement(group_size)
+        
+        # Judges loaded by load_judges are checked against the availability matrix
+        free = self._free_slot_mask(required_judges, max_parallel)
+        if free is not None:
+            return [self._time_cols[i] for i in np.flatnonzero(free)]
+        
         # Get all possible time slots from first judge
         all_time_slots = list(required_judges[0].availability.keys())
         available_slots = []
         
-        constraints = self.config.scheduling_constraints
-        max_parallel = constraints.get('max_parallel_defenses', 3)
-        time_requirement = self.config.get_group_time_requirement(group_size)
-        
         for time_slot in all_time_slots:
             # Check if we can schedule another parallel defense in this time slot
             if not self.session.can_schedule_parallel_defense(time_slot, max_parallel):
@@ -339,7 +569,7 @@ class SchedulingEngine:
         expertise_matches = self.find_expertise_matches(student, judges, supervisor_judges)
         
         # Select exactly 2 examiner judges based on expertise
-        constraints = self.config.scheduling_constraints
+        constraints = self._constraints
         required_judges_count = constraints['required_judges']
         
         selected_examiners = self.judge_selector.select_judges_by_expertise(
@@ -348,6 +578,7 @@ class SchedulingEngine:
             student.field2,
             required_judges_count
         )
+        self.judge_selector.flush_log()
         
         examiner_judges = selected_examiners
         print(f"✓ Found {len(supervisor_judges)} supervisors, {len(examiner_judges)} examiners with field expertise")
@@ -356,12 +587,13 @@ class SchedulingEngine:
             print(f"⚠ Insufficient examiners with field expertise ({len(examiner_judges)}/{required_judges_count})")
             return None
         
-        # Find available time slots for all required judges
-        all_required_judges = supervisor_judges + examiner_judges
+        # Find the first time slot where all required judges are available
         group_size = 1  # Individual defense
-        available_slots = self.find_available_time_slots(all_required_judges, group_size)
+        max_parallel = constraints.get('max_parallel_defenses', 3)
+        first_slot = self._first_available_slot(self._free_slot_bits(supervisor_judges, max_parallel),
+                                                examiner_judges, supervisor_judges, group_size)
         
-        if not available_slots:
+        if not first_slot:
             print("✗ No available time slots found for field-matched judges")
             return None
         
@@ -369,7 +601,7 @@ class SchedulingEngine:
         panel = PanelConfiguration(
             supervisors=supervisor_judges,
             examiners=examiner_judges,
-            time_slot=available_slots[0]
+            time_slot=first_slot
         )
         
         return panel
@@ -389,14 +621,15 @@ class SchedulingEngine:
             PanelConfiguration if successful, None otherwise
         """
         # Get all non-supervisor judges (ignore expertise for now)
-        supervisor_codes = [judge.code for judge in supervisor_judges]
+        supervisor_codes = {judge.code for judge in supervisor_judges}
         available_examiners = [judge for judge in judges if judge.code not in supervisor_codes]
         
         # Sort available examiners by workload (ascending - least loaded first)
-        available_examiners = sorted(available_examiners, 
-                                   key=lambda j: self.session.get_judge_workload(j.code))
+        # Workloads don't change during the search, so they are looked up once per examiner
+        workload = {judge.code: self.session.get_judge_workload(judge.code) for judge in available_examiners}
+        available_examiners = sorted(available_examiners, key=lambda j: workload[j.code])
         
-        constraints = self.config.scheduling_constraints
+        constraints = self._constraints
         required_judges_count = constraints['required_judges']
         
         if len(available_examiners) < required_judges_count:
@@ -409,31 +642,36 @@ class SchedulingEngine:
         best_time_slot = None
         best_workload_sum = float('inf')
         
+        # Supervisors are the same for every combination, so their free slots are computed once
+        max_parallel = constraints.get('max_parallel_defenses', 3)
+        supervisor_bits = self._free_slot_bits(supervisor_judges, max_parallel)
+        
         for examiner_combo in combinations(available_examiners, required_judges_count):
             examiner_judges = list(examiner_combo)
-            all_required_judges = supervisor_judges + examiner_judges
             group_size = 1  # Individual defense
-            available_slots = self.find_available_time_slots(all_required_judges, group_size)
             
-            if available_slots:
-                # Calculate total workload for this combination
-                combo_workload = sum(self.session.get_judge_workload(judge.code) for judge in examiner_judges)
+            # Calculate total workload for this combination; only a lower one can replace the best,
+            # so the time slot search is skipped otherwise
+            combo_workload = sum(workload[judge.code] for judge in examiner_judges)
+            if combo_workload >= best_workload_sum:
+                continue
+            first_slot = self._first_available_slot(supervisor_bits, examiner_judges, supervisor_judges, group_size)
+            
+            if first_slot:
+                best_combo = examiner_judges
+                best_time_slot = first_slot
+                best_workload_sum = combo_workload
+                
+                # Log the workload information
+                workload_info = [f"{judge.code}({workload[judge.code]})" for judge in examiner_judges]
+                print(f"🔹 Found better combo with total workload {combo_workload}: {' + '.join(workload_info)}")
                 
-                if combo_workload < best_workload_sum:
-                    best_combo = examiner_judges
-                    best_time_slot = available_slots[0]
-                    best_workload_sum = combo_workload
-                    
-                    # Log the workload information
-                    workload_info = [f"{judge.code}({self.session.get_judge_workload(judge.code)})" for judge in examiner_judges]
-                    print(f"🔹 Found better combo with total workload {combo_workload}: {' + '.join(workload_info)}")
-                    
-                    # If we found a combination with very low workload, use it immediately
-                    if combo_workload <= required_judges_count:  # Very low workload
-                        break
+                # If we found a combination with very low workload, use it immediately
+                if combo_workload <= required_judges_count:  # Very low workload
+                    break
         
         if best_combo and best_time_slot:
-            workload_info = [f"{judge.code}({self.session.get_judge_workload(judge.code)})" for judge in best_combo]
+            workload_info = [f"{judge.code}({workload[judge.code]})" for judge in best_combo]
             print(f"✓ Selected best workload combo: {' + '.join(workload_info)} (total: {best_workload_sum})")
             print(f"✓ Found {len(supervisor_judges)} supervisors, {len(best_combo)} examiners (time-only match)")
             
@@ -525,7 +763,7 @@ class SchedulingEngine:
         expertise_matches = self.find_expertise_matches(primary_student, judges, supervisor_judges)
         
         # Select exactly 2 examiner judges based on expertise
-        constraints = self.config.scheduling_constraints
+        constraints = self._constraints
         required_judges_count = constraints['required_judges']
         
         selected_examiners = self.judge_selector.select_judges_by_expertise(
@@ -534,6 +772,7 @@ class SchedulingEngine:
             primary_student.field2,
             required_judges_count
         )
+        self.judge_selector.flush_log()
         
         examiner_judges = selected_examiners
         print(f"✓ Found {len(supervisor_judges)} supervisors, {len(examiner_judges)} examiners with field expertise")
@@ -542,11 +781,12 @@ class SchedulingEngine:
             print(f"⚠ Insufficient examiners with field expertise ({len(examiner_judges)}/{required_judges_count})")
             return None
         
-        # Find available time slots for all required judges (considering group size)
-        all_required_judges = supervisor_judges + examiner_judges
-        available_slots = self.find_available_time_slots(all_required_judges, group_size)
+        # Find the first time slot where all required judges are available (considering group size)
+        max_parallel = constraints.get('max_parallel_defenses', 3)
+        first_slot = self._first_available_slot(self._free_slot_bits(supervisor_judges, max_parallel),
+                                                examiner_judges, supervisor_judges, group_size)
         
-        if not available_slots:
+        if not first_slot:
             print("✗ No available time slots found for field-matched judges")
             return None
         
@@ -554,7 +794,7 @@ class SchedulingEngine:
         panel = PanelConfiguration(
             supervisors=supervisor_judges,
             examiners=examiner_judges,
-            time_slot=available_slots[0]
+            time_slot=first_slot
         )
         
         return panel
@@ -563,14 +803,15 @@ class SchedulingEngine:
                                   supervisor_judges: List[Judge], group_size: int) -> Optional[PanelConfiguration]:
         """Try to create a panel with time matching only for group defense."""
         # Get all non-supervisor judges (ignore expertise for now)
-        supervisor_codes = [judge.code for judge in supervisor_judges]
+        supervisor_codes = {judge.code for judge in supervisor_judges}
         available_examiners = [judge for judge in judges if judge.code not in supervisor_codes]
         
         # Sort available examiners by workload (ascending - least loaded first)
-        available_examiners = sorted(available_examiners, 
-                                   key=lambda j: self.session.get_judge_workload(j.code))
+        # Workloads don't change during the search, so they are looked up once per examiner
+        workload = {judge.code: self.session.get_judge_workload(judge.code) for judge in available_examiners}
+        available_examiners = sorted(available_examiners, key=lambda j: workload[j.code])
         
-        constraints = self.config.scheduling_constraints
+        constraints = self._constraints
         required_judges_count = constraints['required_judges']
         
         if len(available_examiners) < required_judges_count:
@@ -582,30 +823,35 @@ class SchedulingEngine:
         best_time_slot = None
         best_workload_sum = float('inf')
         
+        # Supervisors are the same for every combination, so their free slots are computed once
+        max_parallel = constraints.get('max_parallel_defenses', 3)
+        supervisor_bits = self._free_slot_bits(supervisor_judges, max_parallel)
+        
         for examiner_combo in combinations(available_examiners, required_judges_count):
             examiner_judges = list(examiner_combo)
-            all_required_judges = supervisor_judges + examiner_judges
-            available_slots = self.find_available_time_slots(all_required_judges, group_size)
             
-            if available_slots:
-                # Calculate total workload for this combination
-                combo_workload = sum(self.session.get_judge_workload(judge.code) for judge in examiner_judges)
+            # Calculate total workload for this combination; only a lower one can replace the best,
+            # so the time slot search is skipped otherwise
+            combo_workload = sum(workload[judge.code] for judge in examiner_judges)
+            if combo_workload >= best_workload_sum:
+                continue
+            first_slot = self._first_available_slot(supervisor_bits, examiner_judges, supervisor_judges, group_size)
+            
+            if first_slot:
+                best_combo = examiner_judges
+                best_time_slot = first_slot
+                best_workload_sum = combo_workload
+                
+                # Log the workload information
+                workload_info = [f"{judge.code}({workload[judge.code]})" for judge in examiner_judges]
+                print(f"🔹 Found better group combo with total workload {combo_workload}: {' + '.join(workload_info)}")
                 
-                if combo_workload < best_workload_sum:
-                    best_combo = examiner_judges
-                    best_time_slot = available_slots[0]
-                    best_workload_sum = combo_workload
-                    
-                    # Log the workload information
-                    workload_info = [f"{judge.code}({self.session.get_judge_workload(judge.code)})" for judge in examiner_judges]
-                    print(f"🔹 Found better group combo with total workload {combo_workload}: {' + '.join(workload_info)}")
-                    
-                    # If we found a combination with very low workload, use it immediately
-                    if combo_workload <= required_judges_count:  # Very low workload
-                        break
+                # If we found a combination with very low workload, use it immediately
+                if combo_workload <= required_judges_count:  # Very low workload
+                    break
         
         if best_combo and best_time_slot:
-            workload_info = [f"{judge.code}({self.session.get_judge_workload(judge.code)})" for judge in best_combo]
+            workload_info = [f"{judge.code}({workload[judge.code]})" for judge in best_combo]
             print(f"✓ Selected best workload combo for group: {' + '.join(workload_info)} (total: {best_workload_sum})")
             print(f"✓ Found {len(supervisor_judges)} supervisors, {len(best_combo)} examiners (time-only match)")
             
@@ -631,7 +877,8 @@ class SchedulingEngine:
             ) for student in group.students]
         
         # Reserve the time slot
-        self.session.reserve_time_slot(panel.time_slot, panel.get_all_judge_codes())
+        panel_codes = panel.get_all_judge_codes()
+        self._reserve_time_slot(panel.time_slot, panel_codes)
         
         # Create results for all students in the group
         results = []
@@ -646,8 +893,8 @@ class SchedulingEngine:
             result = ScheduleResult(
                 student=student,
                 scheduled=True,
-                time_slot=self.time_formatter.format_time_slot(panel.time_slot),
-                panel_judges=panel.get_all_judge_codes(),
+                time_slot=self._format_time_slot(panel.time_slot),
+                panel_judges=list(panel_codes),
                 recommended_judges=recommendations,
                 reason="Successfully scheduled (group defense)",
                 status=f"{status} (Group {group.group_id})"
@@ -658,7 +905,7 @@ class SchedulingEngine:
         student_names = ', '.join([s.name for s in group.students])
         print(f"✓ Group {group.group_id} scheduled at {results[0].time_slot}")
         print(f"✓ Students: {student_names}")
-        print(f"✓ Panel: {', '.join(panel.get_all_judge_codes())}")
+        print(f"✓ Panel: {', '.join(panel_codes)}")
         print(f"✓ Recommendations: {' | '.join(recommendations)}")
         print(f"✓ Status: {status}")
         
@@ -682,7 +929,8 @@ class SchedulingEngine:
             
             if panel and panel.is_valid() and panel.time_slot:
                 # Reserve the time slot
-                self.session.reserve_time_slot(panel.time_slot, panel.get_all_judge_codes())
+                panel_codes = panel.get_all_judge_codes()
+                self._reserve_time_slot(panel.time_slot, panel_codes)
                 
                 # Create result with exactly 2 examiner recommendations
                 examiner_codes = [judge.code for judge in panel.examiners]
@@ -695,15 +943,15 @@ class SchedulingEngine:
                 result = ScheduleResult(
                     student=student,
                     scheduled=True,
-                    time_slot=self.time_formatter.format_time_slot(panel.time_slot),
-                    panel_judges=panel.get_all_judge_codes(),
+                    time_slot=self._format_time_slot(panel.time_slot),
+                    panel_judges=panel_codes,
                     recommended_judges=recommendations,
                     reason="Successfully scheduled",
                     status=status
                 )
                 
                 print(f"✓ Scheduled at {result.time_slot}")
-                print(f"✓ Panel: {', '.join(panel.get_all_judge_codes())}")
+                print(f"✓ Panel: {', '.join(panel_codes)}")
                 print(f"✓ Recommendations: {' | '.join(recommendations)}")
                 print(f"✓ Status: {status}")
                 
@@ -738,6 +986,9 @@ class SchedulingEngine:
         total_entities = len(grouped_defenses) + len(individual_students)
         print(f"\nProcessing {total_entities} scheduling entities ({len(grouped_defenses)} groups, {len(individual_students)} individuals)...")
         
+        # Index judges by expertise once, so examiner selection doesn't re-partition them per student
+        self.judge_selector.index_judges(judges)
+        
         results = []
         
         # Process group defenses first (they have more constraints)
@@ -771,7 +1022,8 @@ class SchedulingEngine:
             'failed_count': failed_count,
             'group_defenses': group_defenses,
             'individual_defenses': individual_defenses,
-            'time_slot_utilization': self.session.get_utilization_summary(),
-            'judge_workload': self.session.get_workload_summary(),
-            'parallel_defenses': self.session.get_parallel_defenses_summary()
+            # Snapshots, so the summary can be serialized and does not change with later scheduling
+            'time_slot_utilization': dict(self.session.get_utilization_summary()),
+            'judge_workload': dict(self.session.get_workload_summary()),
+            'parallel_defenses': dict(self.session.get_parallel_defenses_summary())
         }
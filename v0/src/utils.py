@@ -6,17 +6,45 @@ This module contains helper functions for data processing, parsing,
 and formatting operations.
 """
 
+import heapq
 import re
+from collections import defaultdict
+from functools import lru_cache
 import pandas as pd
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, Mapping
 from .config import Config
 
+# Month name to two-digit month number, used when formatting time slot columns
+MONTH_MAP = {
+    'January': '01', 'February': '02', 'March': '03', 'April': '04',
+    'May': '05', 'June': '06', 'July': '07', 'August': '08',
+    'September': '09', 'October': '10', 'November': '11', 'December': '12'
+}
+
+# Cleaned time slot column name, e.g. "Tuesday_10_June_2025_08:00"
+TIME_SLOT_PATTERN = re.compile(r'^[^_]+_(\d{1,2})_([A-Za-z]+)_(\d{4})_(\d{2}):(\d{2})$')
+
+
+@lru_cache(maxsize=4096)
+def _parse_expertise_codes_cached(expertise_string: str) -> Tuple[str, ...]:
+    """Split a non-empty expertise string into codes; cached since each judge's string repeats."""
+    # Split by semicolon and clean up
+    codes = [code.strip() for code in expertise_string.split(';')]
+    return tuple(code for code in codes if len(code) >= 3)
+
 
 class DataProcessor:
     """Handles data processing and parsing operations."""
     
     def __init__(self, config: Config):
         self.config = config
+        # Judge names (lowercased) and expertise strings of the last availability
+        # DataFrame seen by normalize_supervisor_code, so it isn't re-scanned per call
+        self._judge_name_source: Optional[pd.DataFrame] = None
+        self._judge_names: List[str] = []
+        self._judge_expertise: List[Any] = []
+        # Resolved code per lowercased supervisor name (None when no judge name matches)
+        self._supervisor_matches: Dict[str, Optional[str]] = {}
     
     def parse_expertise_codes(self, expertise_string: str) -> List[str]:
         """
@@ -31,9 +59,13 @@ class DataProcessor:
         if pd.isna(expertise_string) or expertise_string == '':
             return []
         
-        # Split by semicolon and clean up
-        codes = [code.strip() for code in str(expertise_string).split(';')]
-        return [code for code in codes if len(code) >= 3]
+        expertise_string = str(expertise_string)
+        # Most strings hold a single code, which needs no splitting
+        if ';' not in expertise_string:
+            code = expertise_string.strip()
+            return [code] if len(code) >= 3 else []
+        
+        return list(_parse_expertise_codes_cached(expertise_string))
     
     def get_judge_code(self, expertise_string: str) -> str:
         """
@@ -65,17 +97,58 @@ class DataProcessor:
             return supervisor_name.upper()
         
         # Try to match with judge names to get their code
-        name_col = self.config.column_mappings['availability']['name']
-        expertise_col = self.config.column_mappings['availability']['expertise']
-        for _, judge in availability_df.iterrows():
-            # Check if both supervisor_name and judge name are not null/NaN
-            judge_name = judge[name_col]
-            if (pd.notna(supervisor_name) and pd.notna(judge_name) and 
-                str(supervisor_name).lower() in str(judge_name).lower()):
-                return self.get_judge_code(judge[expertise_col])
+        if pd.notna(supervisor_name):
+            self._index_judge_names(availability_df)
+            supervisor_lower = str(supervisor_name).lower()
+            if supervisor_lower not in self._supervisor_matches:
+                self._supervisor_matches[supervisor_lower] = self._match_judge_name(supervisor_lower)
+            judge_code = self._supervisor_matches[supervisor_lower]
+            if judge_code is not None:
+                return judge_code
         
         return supervisor_name.upper()
     
+    def _match_judge_name(self, supervisor_lower: str) -> Optional[str]:
+        """
+        Find the code of the first judge whose name contains the supervisor name.
+        
+        Args:
+            supervisor_lower: Lowercased supervisor name
+            
+        Returns:
+            Judge code, or None if no judge name matches
+        """
+        for judge_name, expertise in zip(self._judge_names, self._judge_expertise):
+            # Judge names that are null/NaN are stored as None
+            if judge_name is not None and supervisor_lower in judge_name:
+                return self.get_judge_code(expertise)
+        return None
+    
+    def _index_judge_names(self, availability_df: pd.DataFrame):
+        """
+        Extract lowercased judge names and expertise strings once per availability DataFrame.
+        
+        Args:
+            availability_df: DataFrame with judge availability data
+        """
+        if availability_df is self._judge_name_source:
+            return
+        
+        self._judge_name_source = availability_df
+        self._supervisor_matches = {}
+        
+        # An empty frame has no judges to match (and may lack the columns altogether)
+        if availability_df.empty:
+            self._judge_names = []
+            self._judge_expertise = []
+            return
+        
+        name_col = self.config.column_mappings['availability']['name']
+        expertise_col = self.config.column_mappings['availability']['expertise']
+        self._judge_names = [str(name).lower() if pd.notna(name) else None
+                             for name in availability_df[name_col].tolist()]
+        self._judge_expertise = availability_df[expertise_col].tolist()
+    
     def get_time_slot_columns(self, df: pd.DataFrame) -> List[str]:
         """
         Get time slot column names from availability DataFrame.
@@ -100,12 +173,14 @@ class DataProcessor:
             DataFrame with boolean availability columns
         """
         time_cols = self.get_time_slot_columns(df)
-        df_copy = df.copy()
-        
-        for col in time_cols:
-            df_copy[col] = df_copy[col].astype(bool)
-        
-        return df_copy
+        if not time_cols:
+            return df.copy()
+        
+        # Cast the whole block of time columns at once into a new boolean array and join it
+        # with the other columns, instead of copying the full frame and overwriting the block
+        bool_block = pd.DataFrame(df[time_cols].to_numpy(dtype=bool), index=df.index, columns=time_cols)
+        combined = pd.concat([df.drop(columns=time_cols), bool_block], axis=1, copy=False)
+        return combined[list(df.columns)]
 
 
 class TimeFormatter:
@@ -113,6 +188,8 @@ class TimeFormatter:
     
     def __init__(self, config: Config):
         self.config = config
+        # Time slot column names form a small fixed set, so each is formatted only once
+        self._fmt_cache: Dict[str, str] = {}
     
     def format_time_slot(self, time_slot: str) -> str:
         """
@@ -124,7 +201,23 @@ class TimeFormatter:
         Returns:
             Formatted time string
         """
-        # Handle the new cleaned format: "Tuesday_10_June_2025_08:00"
+        cached = self._fmt_cache.get(time_slot)
+        if cached is not None:
+            return cached
+        
+        formatted = self._format_time_slot_uncached(time_slot)
+        self._fmt_cache[time_slot] = formatted
+        return formatted
+    
+    def _format_time_slot_uncached(self, time_slot: str) -> str:
+        """Convert a time slot column name without consulting the cache."""
+        # Cleaned column names match the pattern and are formatted straight from its groups
+        match = TIME_SLOT_PATTERN.match(time_slot)
+        if match:
+            date, month, year, hour, minute = match.groups()
+            return f"{year}{MONTH_MAP.get(month, '01')}{date.zfill(2)}-{hour}{minute}"
+        
+        # Looser variants of the cleaned format (extra parts, unpadded hours)
         parts = time_slot.split('_')
         if len(parts) >= 5:
             # parts[0] = weekday (Tuesday)
@@ -138,13 +231,7 @@ class TimeFormatter:
             year = parts[3]
             time = parts[4]
             
-            # Define month mapping directly here for now
-            month_map = {
-                'January': '01', 'February': '02', 'March': '03', 'April': '04',
-                'May': '05', 'June': '06', 'July': '07', 'August': '08',
-                'September': '09', 'October': '10', 'November': '11', 'December': '12'
-            }
-            month_num = month_map.get(month, '01')
+            month_num = MONTH_MAP.get(month, '01')
             date_padded = date.zfill(2)
             time_formatted = time.replace(':', '')
             
@@ -160,11 +247,26 @@ class JudgeSelector:
     def __init__(self, config: Config):
         self.config = config
         self.session = None  # Will be set by SchedulingEngine
+        self.data_processor = DataProcessor(config)  # Parses expertise of dictionary judges
+        # Expertise code -> Judge objects, built once per scheduling run by index_judges
+        self._judges_by_field: Optional[Dict[str, List[Any]]] = None
+        self._indexed_ids = set()
+        # Selection messages collected during a selection call, printed together by flush_log
+        self._log_buffer: List[str] = []
     
     def set_session(self, session):
         """Set the scheduling session for workload tracking."""
         self.session = session
     
+    def index_judges(self, judges):
+        """Build the expertise code -> judges index used to partition candidates by field."""
+        self._judges_by_field = defaultdict(list)
+        self._indexed_ids = set()
+        for judge in judges:
+            for code in judge._expertise_set:
+                self._judges_by_field[code].append(judge)
+            self._indexed_ids.add(id(judge))
+    
     def select_judges_by_expertise(self, available_judges, 
                                  field1: str, field2: str, max_judges: int = 2):
         """
@@ -186,77 +288,123 @@ class JudgeSelector:
         field2_upper = field2.upper()
         
         # Separate judges by expertise match
-        field1_matches = []
-        field2_matches = []
-        other_judges = []
-        
-        for judge in available_judges:
-            # Handle both Judge objects and dictionaries
-            if hasattr(judge, 'has_expertise_in'):
-                # Judge object
-                if judge.has_expertise_in(field1_upper):
-                    field1_matches.append(judge)
-                elif judge.has_expertise_in(field2_upper):
-                    field2_matches.append(judge)
-                else:
-                    other_judges.append(judge)
-            else:
-                # Dictionary - use existing logic
-                from .config import Config
-                processor = DataProcessor(Config())
-                expertise = processor.parse_expertise_codes(judge.get('Sub_Keilmuan', ''))
-                
-                if field1_upper in expertise:
-                    field1_matches.append(judge)
-                elif field2_upper in expertise:
-                    field2_matches.append(judge)
-                else:
-                    other_judges.append(judge)
+        if self._judges_by_field is not None and all(id(j) in self._indexed_ids for j in available_judges):
+            field1_matches, field2_matches = self._partition_by_index(available_judges, field1_upper, field2_upper)
+        else:
+            field1_matches, field2_matches = self._partition_by_expertise(available_judges, field1_upper, field2_upper)
         
-        # Sort each category by workload (ascending - least loaded first)
-        if self.session:
-            field1_matches = self._sort_by_workload(field1_matches)
-            field2_matches = self._sort_by_workload(field2_matches)
-            other_judges = self._sort_by_workload(other_judges)
+        # Workloads don't change during a selection, so each judge's is looked up once
+        workload = self._workload_lookup()
         
         # Select judges with priority
         selected_judges: List[Any] = []
+        # Identities of the selected judges, so membership tests don't compare whole Judge objects
+        selected_ids = set()
         
         # Priority 1: Field 1 matches (least loaded first)
         if field1_matches and len(selected_judges) < max_judges:
-            selected_judges.append(field1_matches[0])
+            judge = self._least_loaded(field1_matches, workload)
+            selected_judges.append(judge)
+            selected_ids.add(id(judge))
             if self.session:
-                print(f"🔹 Selected {self._get_judge_code(field1_matches[0])} for field1 '{field1}' (workload: {self.session.get_judge_workload(self._get_judge_code(field1_matches[0]))})")
+                self._log_buffer.append(f"🔹 Selected {self._get_judge_code(judge)} for field1 '{field1}' (workload: {workload(judge)})")
         
         # Priority 2: Field 2 matches (different from field 1 match, least loaded first)
         if field2_matches and len(selected_judges) < max_judges:
-            for judge in field2_matches:
-                if judge not in selected_judges:
-                    selected_judges.append(judge)
-                    if self.session:
-                        print(f"🔹 Selected {self._get_judge_code(judge)} for field2 '{field2}' (workload: {self.session.get_judge_workload(self._get_judge_code(judge))})")
-                    break
+            field2_candidates = [j for j in field2_matches if id(j) not in selected_ids]
+            if field2_candidates:
+                judge = self._least_loaded(field2_candidates, workload)
+                selected_judges.append(judge)
+                selected_ids.add(id(judge))
+                if self.session:
+                    self._log_buffer.append(f"🔹 Selected {self._get_judge_code(judge)} for field2 '{field2}' (workload: {workload(judge)})")
         
         # Priority 3: Fill remaining slots with any available judges (least loaded first)
         if len(selected_judges) < max_judges:
-            remaining_judges = [j for j in available_judges if j not in selected_judges]
-            remaining_judges = self._sort_by_workload(remaining_judges) if self.session else remaining_judges
+            remaining_judges = [j for j in available_judges if id(j) not in selected_ids]
+            max_needed = max_judges - len(selected_judges)
+            remaining_judges = self._sort_by_workload(remaining_judges, workload, max_needed) if self.session else remaining_judges
             
             for judge in remaining_judges:
                 if len(selected_judges) >= max_judges:
                     break
                 selected_judges.append(judge)
+                selected_ids.add(id(judge))
                 if self.session:
-                    print(f"🔹 Selected {self._get_judge_code(judge)} as fallback (workload: {self.session.get_judge_workload(self._get_judge_code(judge))})")
+                    self._log_buffer.append(f"🔹 Selected {self._get_judge_code(judge)} as fallback (workload: {workload(judge)})")
         
         return selected_judges
     
-    def _sort_by_workload(self, judges):
-        """Sort judges by current workload (ascending - least loaded first)."""
+    def flush_log(self):
+        """Print the selection messages collected since the last flush in one write."""
+        if self._log_buffer:
+            print("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+    
+    def _partition_by_index(self, available_judges, field1_upper: str, field2_upper: str):
+        """Get field 1 and field 2 matches among indexed judges, in available_judges order."""
+        position = {id(judge): i for i, judge in enumerate(available_judges)}
+        field1_matches = [j for j in self._judges_by_field.get(field1_upper, ()) if id(j) in position]
+        field1_ids = {id(j) for j in field1_matches}
+        field2_matches = [j for j in self._judges_by_field.get(field2_upper, ())
+                          if id(j) in position and id(j) not in field1_ids]
+        
+        field1_matches.sort(key=lambda j: position[id(j)])
+        field2_matches.sort(key=lambda j: position[id(j)])
+        return field1_matches, field2_matches
+    
+    def _partition_by_expertise(self, available_judges, field1_upper: str, field2_upper: str):
+        """Get field 1 and field 2 matches by checking each judge's expertise."""
+        field1_matches = []
+        field2_matches = []
+        
+        for judge in available_judges:
+            # Handle both Judge objects and dictionaries
+            if hasattr(judge, 'has_expertise_in'):
+                # Judge object
+                if judge.has_expertise_in(field1_upper):
+                    field1_matches.append(judge)
+                elif judge.has_expertise_in(field2_upper):
+                    field2_matches.append(judge)
+            else:
+                # Dictionary - use existing logic
+                expertise = set(self.data_processor.parse_expertise_codes(judge.get('Sub_Keilmuan', '')))
+                
+                if field1_upper in expertise:
+                    field1_matches.append(judge)
+                elif field2_upper in expertise:
+                    field2_matches.append(judge)
+        
+        return field1_matches, field2_matches
+    
+    def _workload_lookup(self):
+        """Get a judge -> workload function that caches session lookups by judge code."""
+        workload_cache: Dict[str, int] = {}
+        
+        def workload(judge) -> int:
+            code = self._get_judge_code(judge)
+            if code not in workload_cache:
+                workload_cache[code] = self.session.get_judge_workload(code)
+            return workload_cache[code]
+        
+        return workload
+    
+    def _least_loaded(self, judges, workload):
+        """Get the judge with the lowest current workload (first one on ties)."""
+        if not self.session:
+            return judges[0]
+        
+        return min(judges, key=workload)
+    
+    def _sort_by_workload(self, judges, workload, limit: Optional[int] = None):
+        """Sort judges by current workload (ascending - least loaded first), keeping only `limit` if given."""
         if not self.session:
             return judges
         
-        return sorted(judges, key=lambda j: self.session.get_judge_workload(self._get_judge_code(j)))
+        if limit is not None:
+            # Same order as sorted(...)[:limit] without sorting the whole list
+            return heapq.nsmallest(limit, judges, key=workload)
+        return sorted(judges, key=workload)
     
     def _get_judge_code(self, judge):
         """Get judge code from either Judge object or dictionary."""
@@ -282,7 +430,8 @@ class ValidationHelper:
         Returns:
             True if valid, False otherwise
         """
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        present_columns = set(df.columns)
+        missing_columns = [col for col in required_columns if col not in present_columns]
         if missing_columns:
             print(f"Missing required columns: {missing_columns}")
             return False
@@ -310,6 +459,31 @@ class ValidationHelper:
                 return False
         
         return True
+    
+    @staticmethod
+    def validate_student_dataframe(df: pd.DataFrame, required_fields: Optional[List[str]] = None) -> pd.Series:
+        """
+        Validate all student requests at once, column by column.
+        
+        Args:
+            df: DataFrame containing student data
+            required_fields: List of required field names (same default as validate_student_data)
+            
+        Returns:
+            Boolean Series aligned with df, True where the row has every required field
+        """
+        if required_fields is None:
+            required_fields = ['Nama', 'Nim', 'Field 1', 'Field 2', 'SPV 1']
+        
+        valid_mask = pd.Series(True, index=df.index)
+        for field in required_fields:
+            if field not in df.columns:
+                return pd.Series(False, index=df.index)
+            # Same rule as validate_student_data: value must be present and truthy
+            values = df[field]
+            valid_mask &= values.notna() & values.fillna(False).astype(bool)
+        
+        return valid_mask
 
 
 class ReportGenerator:
@@ -318,9 +492,9 @@ class ReportGenerator:
     def __init__(self, config: Config):
         self.config = config
     
-    def generate_scheduling_summary(self, results: List, scheduled_slots: Dict[str, List[str]], 
-                                  judge_workload: Optional[Dict[str, int]] = None,
-                                  parallel_defenses: Optional[Dict[str, int]] = None) -> str:
+    def generate_scheduling_summary(self, results: List, scheduled_slots: Mapping[str, List[str]], 
+                                  judge_workload: Optional[Mapping[str, int]] = None,
+                                  parallel_defenses: Optional[Mapping[str, int]] = None) -> str:
         """
         Generate a comprehensive scheduling summary.
         
@@ -332,9 +506,21 @@ class ReportGenerator:
         Returns:
             Formatted summary string
         """
+        # Split results into scheduled and failed and count statuses in a single pass
+        scheduled_results = []
+        failed_results = []
+        status_counts: Dict[str, int] = {}
+        has_status = False
+        for result in results:
+            (scheduled_results if result.get('scheduled', False) else failed_results).append(result)
+            status = result.get('status', 'Unknown')
+            status_counts[status] = status_counts.get(status, 0) + 1
+            if result.get('status'):
+                has_status = True
+        
         total_count = len(results)
-        scheduled_count = sum(1 for r in results if r.get('scheduled', False))
-        failed_count = total_count - scheduled_count
+        scheduled_count = len(scheduled_results)
+        failed_count = len(failed_results)
         
         summary = []
         summary.append("="*60)
@@ -346,12 +532,7 @@ class ReportGenerator:
         summary.append(f"Success rate: {(scheduled_count/total_count*100):.1f}%")
         
         # Add status breakdown if available
-        if results and any(r.get('status') for r in results):
-            status_counts: Dict[str, int] = {}
-            for result in results:
-                status = result.get('status', 'Unknown')
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
+        if has_status:
             summary.append("\n📊 SCHEDULING STATUS BREAKDOWN:")
             for status, count in status_counts.items():
                 percentage = (count/total_count*100)
@@ -359,22 +540,18 @@ class ReportGenerator:
         
         if scheduled_count > 0:
             summary.append("\n🗓️  SCHEDULED DEFENSES:")
-            for result in results:
-                if result.get('scheduled', False):
-                    name = result.get('student_name', 'Unknown')
-                    time_slot = result.get('recommended_times', ['Unknown'])[0]
-                    judges = ' | '.join(result.get('recommended_judges', ['NONE', 'NONE']))
-                    status = result.get('status', '')
-                    summary.append(f"   • {name} - {time_slot} - Judges: {judges} - {status}")
+            for result in scheduled_results:
+                get = result.get
+                judges = ' | '.join(get('recommended_judges', ['NONE', 'NONE']))
+                summary.append(f"   • {get('student_name', 'Unknown')} - {get('recommended_times', ['Unknown'])[0]}"
+                               f" - Judges: {judges} - {get('status', '')}")
         
         if failed_count > 0:
             summary.append("\n❌ FAILED TO SCHEDULE:")
-            for result in results:
-                if not result.get('scheduled', False):
-                    name = result.get('student_name', 'Unknown')
-                    reason = result.get('reason', 'Unknown error')
-                    judges = ' | '.join(result.get('recommended_judges', ['NONE', 'NONE']))
-                    summary.append(f"   • {name} - {reason} - Judges: {judges}")
+            for result in failed_results:
+                get = result.get
+                judges = ' | '.join(get('recommended_judges', ['NONE', 'NONE']))
+                summary.append(f"   • {get('student_name', 'Unknown')} - {get('reason', 'Unknown error')} - Judges: {judges}")
         
         if scheduled_slots:
             summary.append("\n⏰ TIME SLOT UTILIZATION:")
@@ -12,6 +12,7 @@ Example:
 """
 
 import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -37,8 +38,9 @@ def validate_timeslots(csv_path: str, max_parallel: int = 1) -> bool:
     print(f"File: {csv_path}")
     print(f"Maximum parallel events: {max_parallel}\n")
     
-    # Read the timeslot dataframe
-    df = pd.read_csv(csv_path)
+    # Read the timeslot dataframe; every column holds text (dates, times, occupant IDs or 'none'),
+    # so values are kept as strings instead of running type inference
+    df = pd.read_csv(csv_path, dtype=str)
     
     # Get slot columns
     slot_columns = [col for col in df.columns if col.startswith('slot_')]
@@ -49,37 +51,32 @@ def validate_timeslots(csv_path: str, max_parallel: int = 1) -> bool:
     
     print(f"Analyzing {len(df)} timeslots with {len(slot_columns)} parallel slots each...\n")
     
-    conflicts = []
-    total_events = 0
+    # Occupied cells: present and not the 'none' placeholder, checked column by column
+    slot_values = df[slot_columns]
+    occupied = slot_values.notna() & (slot_values.apply(lambda col: col.str.lower()) != 'none')
+    occupied_counts = occupied.sum(axis=1).to_numpy()
+    total_events = int(occupied_counts.sum())
     
-    for idx, row in df.iterrows():
-        # Count occupied slots
-        occupied_count = 0
-        occupants = []
-        
-        for slot_col in slot_columns:
-            value = row[slot_col]
-            if pd.notna(value) and str(value).lower() != 'none':
-                occupied_count += 1
-                occupants.append(str(value))
-        
-        total_events += occupied_count
-        
-        # Check if exceeded limit
-        if occupied_count > max_parallel:
-            conflict = {
-                'date': row.get('date', 'Unknown'),
-                'time': row.get('time', 'Unknown'),
-                'occupied': occupied_count,
-                'limit': max_parallel,
-                'excess': occupied_count - max_parallel,
-                'events': occupants
-            }
-            conflicts.append(conflict)
+    # Only rows over the limit are looked at individually
+    conflicts = []
+    for idx in np.flatnonzero(occupied_counts > max_parallel):
+        row = df.iloc[idx]
+        occupied_count = int(occupied_counts[idx])
+        occupants = [str(row[slot_col]) for slot_col, is_occupied in zip(slot_columns, occupied.iloc[idx])
+                     if is_occupied]
+        conflict = {
+            'date': row.get('date', 'Unknown'),
+            'time': row.get('time', 'Unknown'),
+            'occupied': occupied_count,
+            'limit': max_parallel,
+            'excess': occupied_count - max_parallel,
+            'events': occupants
+        }
+        conflicts.append(conflict)
     
     # Report results
     print(f"Total events scheduled: {total_events}")
-    print(f"Total timeslots used: {sum(1 for _, row in df.iterrows() if any(pd.notna(row[col]) and str(row[col]).lower() != 'none' for col in slot_columns))}")
+    print(f"Total timeslots used: {int((occupied_counts > 0).sum())}")
     print(f"\n{'='*60}")
     
     if conflicts: